@@ -256,6 +256,9 @@ CELERY_BROKER_HEARTBEAT = 30
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_TASK_TIME_LIMIT = 10 * 60  # 10 minutes -> 40 pages (conservative est.)
 CELERY_RESULT_EXPIRES = 10 * 60  # 10 minutes -> 40 pages (conservative est.)
+# OCR tasks are long and uneven in duration: reserve one task at a time and
+# start workers with -Ofair so idle processes are never stuck behind a slow
+# one's prefetched backlog.
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_ACKS_LATE = True
 CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {
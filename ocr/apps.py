@@ -6,6 +6,16 @@ class OcrConfig(AppConfig):
     name = "ocr"
 
     def ready(self):
+        import os
+
+        from django.conf import settings
+
         from .config import configure_logging
 
         configure_logging()  # Uses INFO or level set in configure_logging
+
+        # Create the upload directory once at startup rather than on every
+        # upload request
+        os.makedirs(
+            os.path.join(settings.MEDIA_ROOT, "documents"), exist_ok=True
+        )
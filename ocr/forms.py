@@ -14,8 +14,9 @@ class UploadFileForm(forms.Form):
     document or a ZIP file containing multiple PDF documents.
     """
 
+    # Uploads only need the vessel's ID; the name labels the choices
     vessel = forms.ModelChoiceField(
-        queryset=Vessel.objects.all(),
+        queryset=Vessel.objects.only("id", "name"),
         empty_label="— Select Vessel —",
         required=True,
         help_text="Select the vessel associated with these documents",
@@ -89,7 +90,7 @@ class DeleteDocumentsFromVesselForm(forms.Form):
     """
 
     vessel = forms.ModelChoiceField(
-        queryset=Vessel.objects.all(),
+        queryset=Vessel.objects.only("id", "name"),
         empty_label="— Select Vessel —",
         required=True,
         help_text="Select the vessel associated with these documents",
@@ -134,7 +135,7 @@ class DetectByOriginForm(forms.Form):
     """
 
     vessel = forms.ModelChoiceField(
-        queryset=Vessel.objects.all(),
+        queryset=Vessel.objects.only("id", "name"),
         empty_label="— Select Vessel —",
         required=True,
         help_text="Select the vessel associated with the documents to detect",
@@ -186,7 +187,7 @@ class ProcessDetectionsFormByUnprocessed(forms.Form):
     """
 
     vessel = forms.ModelChoiceField(
-        queryset=Vessel.objects.all(),
+        queryset=Vessel.objects.only("id", "name"),
         empty_label="— Select Vessel —",
         required=True,
         help_text="Select the vessel associated with the documents to process",
@@ -249,7 +250,7 @@ class ExportForm(forms.Form):
         help_text="Select a document to export, leave blank to query",
     )
     vessel = forms.ModelChoiceField(
-        queryset=Vessel.objects.all(),
+        queryset=Vessel.objects.only("id", "name"),
         empty_label="— Select Vessel —",
         required=True,
         help_text="Select the vessel associated with the documents to export",
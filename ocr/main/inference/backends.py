@@ -0,0 +1,50 @@
+from typing import Protocol
+
+import modal
+
+
+class OcrBackend(Protocol):
+    """
+    Anything that can run PaddleOCR-style inference on an encoded image.
+
+    Implementations return the raw PaddleOCR ``predict`` output, a list with
+    one result dict (``rec_texts``, ``rec_scores``, ``rec_polys``) per image,
+    or per region when ``regions`` is given. Region results have their polys
+    offset back into full image coordinates.
+    """
+
+    def infer(
+        self,
+        im_bytes: bytes,
+        config_id: int,
+        paddle_config: dict,
+        regions: list[tuple[int, int, int, int]] | None = None,
+    ) -> list: ...
+
+
+class ModalBackend:
+    """
+    Runs OCR remotely on the GPU function deployed in ``ocr/modal_funcs.py``.
+
+    The function handle is looked up once per backend instead of per page.
+    """
+
+    def __init__(
+        self, app_name: str = "modal-ocr", function_name: str = "ocr_inference"
+    ):
+        self._ocr_fn = modal.Function.from_name(app_name, function_name)
+
+    def infer(
+        self,
+        im_bytes: bytes,
+        config_id: int,
+        paddle_config: dict,
+        regions: list[tuple[int, int, int, int]] | None = None,
+    ) -> list:
+        return self._ocr_fn.remote(
+            im_bytes=im_bytes,
+            config_id=config_id,
+            paddle_config=paddle_config,
+            regions=regions,
+        )
+
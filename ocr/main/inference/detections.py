@@ -1,10 +1,18 @@
 import gc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 
+import cv2 as cv
 import numpy as np
 from loguru import logger
 
-from ocr.main.inference.preprocessing.boundaries import figure_table_extraction
-from ocr.main.utils.pdf_utils import get_pdf_object, page_to_image
+from ocr.main.inference.backends import ModalBackend, OcrBackend
+from ocr.main.inference.preprocessing.boundaries import figure_table_regions
+from ocr.main.utils.pdf_utils import (
+    get_pdf_object,
+    make_reusable_bitmap_maker,
+    page_to_image,
+)
 from ocr.models import Detection, Page
 
 
@@ -16,44 +24,67 @@ def _build_detection_list(
     of Detection objects.
 
     Args:
-        results: Results object from the OCR network.
+        results: Results object from the OCR network, one entry per image
+            or region.
         page_id (int): The ID of the Page object this image belongs to.
         config_id (int): The ID of the OCRConfig object used.
 
     Returns:
         list[Detection]: List of Detection objects created from the OCR.
     """
-    # Our predictions come from images so len(results) = 1
-    result_dict = results[0]
-
     detections = []
-    for text, score, bbox in zip(
-        result_dict["rec_texts"],
-        result_dict["rec_scores"],
-        result_dict["rec_polys"],
-    ):
-        if score < min_confidence:  # Default minimum confidence threshold
-            continue
-
-        det = Detection(
-            page_id=page_id,
-            bbox=bbox,
-            confidence=score,
-            text=text,
-            config_id=config_id,
+    # One result per OCR'd image or region, already in page coordinates
+    for result_dict in results:
+        texts = result_dict["rec_texts"]
+        polys = result_dict["rec_polys"]
+        scores = np.asarray(result_dict["rec_scores"], dtype=np.float64)
+
+        # Filter by confidence in one pass; only surviving lines become objects
+        keep_idx = np.flatnonzero(scores >= min_confidence)
+
+        detections.extend(
+            Detection(
+                page_id=page_id,
+                bbox=polys[i],
+                confidence=float(scores[i]),
+                text=texts[i],
+                config_id=config_id,
+            )
+            for i in keep_idx
         )
-        detections.append(det)
 
     return detections
 
 
+def _encode_image(image_np: np.ndarray) -> bytes:
+    """
+    Losslessly encode an image as PNG for transfer to the OCR function.
+
+    Scanned drawings are mostly flat regions, so PNG shrinks them by an
+    order of magnitude while keeping small text pixel-exact. The lowest
+    compression level is used since encode time matters more than the last
+    few percent of size.
+
+    Args:
+        image_np (np.ndarray): Grayscale or 3-channel image array.
+
+    Returns:
+        bytes: The PNG encoded image.
+    """
+    ok, buffer = cv.imencode(".png", image_np, [cv.IMWRITE_PNG_COMPRESSION, 1])
+    if not ok:
+        raise ValueError(f"Failed to encode image of shape {image_np.shape}")
+    return buffer.tobytes()
+
+
 def _extract_detections_from_image(
     image_np: np.ndarray,
-    # ocr,
+    backend: OcrBackend,
     paddle_config: dict,
     config_id: int,
     page_db_id: int,
     min_confidence: float = 0.6,
+    regions: list[tuple[int, int, int, int]] | None = None,
 ) -> list[Detection]:
     """
     Get detections for a given image numpy array using the OCR network.
@@ -61,40 +92,37 @@ def _extract_detections_from_image(
 
     Args:
         image_np (np.ndarray): The image numpy array to process.
-        ocr (PaddleOCR): The configured OCR network.
+        backend (OcrBackend): The backend that runs OCR inference.
+        paddle_config (dict): PaddleOCR parameters from the OCRConfig.
         config_id (int): The id of the OCRConfig object used.
         page_db_id (int): The ID of the Page object this image belongs to.
         min_confidence (float): Minimum confidence threshold for detections.
+        regions (list[tuple], optional): (x1, y1, x2, y2) rects to OCR
+            within the image. The image is sent once and cropped remotely;
+            detections come back in image coordinates. None OCRs the whole
+            image.
 
     Returns:
         list[Detection]: List of detection objects for the image.
     """
-    import modal
-
     logger.info(f"Starting OCR session for page {page_db_id}...")
     logger.debug(f"image_np shape, dtype: {image_np.shape}, {image_np.dtype}")
 
-    # Ensure image has 3 channels (RGB) as expected by PaddleOCR
-    if len(image_np.shape) == 2:
-        logger.debug("Converting 2D grayscale image to 3-channel RGB")
-        image_np = np.stack([image_np] * 3, axis=2)
-        logger.debug(f"After conversion, shape: {image_np.shape}")
-    elif len(image_np.shape) == 3 and image_np.shape[2] == 1:
-        logger.debug("Converting single-channel image to 3-channel RGB")
-        image_np = np.repeat(image_np, 3, axis=2)
-        logger.debug(f"After conversion, shape: {image_np.shape}")
+    # Ship a compressed image instead of the raw array; the modal side
+    # decodes it straight to the 3-channel layout PaddleOCR expects.
+    im_bytes = _encode_image(image_np)
+    logger.debug(
+        f"Encoded {image_np.nbytes} byte image to {len(im_bytes)} bytes"
+    )
 
     try:
-        logger.debug(f"Getting modal function for page {page_db_id}")
-        ocr_fn = modal.Function.from_name("modal-ocr", "ocr_inference")
-
-        logger.debug(f"Calling remote OCR function for page {page_db_id}")
-        ocr_results = ocr_fn.remote(
-            im_numpy=image_np, config_id=config_id, paddle_config=paddle_config
+        logger.debug(f"Calling OCR backend for page {page_db_id}")
+        ocr_results = backend.infer(
+            im_bytes, config_id, paddle_config, regions=regions
         )
 
         logger.debug(f"Checking OCR results for page {page_db_id}")
-        if not ocr_results or not ocr_results[0]:
+        if not ocr_results or not any(ocr_results):
             logger.info(f"[{config_id}] No OCR results for page {page_db_id}")
             return []
 
@@ -110,14 +138,7 @@ def _extract_detections_from_image(
         return detections
 
     except Exception as e:
-        import traceback
-
-        tb_str = traceback.format_exc()
-        logger.error(
-            f"Error in OCR processing for page {page_db_id}: {e}\n"
-            f"Full traceback:\n{tb_str}",
-            exc_info=True,
-        )
+        logger.exception(f"Error in OCR processing for page {page_db_id}: {e}")
         return []
 
     # Clean up
@@ -135,85 +156,144 @@ def _extract_detections_from_image(
 
 def _adjust_and_save_detections(
     detections: list[Detection],
-    offset_x: int,
-    offset_y: int,
     page_render_scale: float,
 ) -> list[Detection]:
     """
     Adjusts the bbox coordinates of detections and saves them.
 
-    We have two adjustments to make to the bbox:
-    1. Add the offset_x and offset_y to each point in the bbox.
-    2. Rescale the bbox points using the page_render_scale factor.
-
     Because we scale the page to a higher resolution for rendering,
-    we need to adjust the bbox points accordingly to match the original
-    dimensions.
+    we need to rescale the bbox points by the page_render_scale factor to
+    match the original dimensions. Region offsets are already applied by
+    the OCR backend.
 
     The bboxes are in the format [[x1,y1],[x2,y2],[x3,y3],[x4,y4]].
 
     Args:
         detections (list[Detection]): List of raw detection objects.
-        offset_x (int): The x-coordinate offset to add to bbox points.
-        offset_y (int): The y-coordinate offset to add to bbox points.
         page_render_scale (float): Upscaling factor for getting detections.
 
     Returns:
         list[Detection]: List of saved detection objects with adjusted bboxes.
     """
-    saved_detections = []
-    for det in detections:
-        logger.debug(det.bbox)
-        logger.debug(type(det.bbox))
-        logger.debug(np.array(det.bbox).shape)
-        logger.debug(np.array(det.bbox)[0])
-        # Adjust poly: [[x1,y1],[x2,y2],[x3,y3],[x4,y4]]
-        adjusted_bbox = [[p[0] + offset_x, p[1] + offset_y] for p in det.bbox]
-        # Rescale bbox points
-        adjusted_bbox = [
-            [p[0] / page_render_scale, p[1] / page_render_scale]
-            for p in adjusted_bbox
+    # Rescale every poly on the page with one division. OCR polys are all
+    # quads, so they stack into an (N, 4, 2) array.
+    try:
+        polys = np.asarray([det.bbox for det in detections], dtype=np.float64)
+    except ValueError:
+        # Ragged polys cannot be stacked; rescale them one at a time
+        rescaled = [
+            (np.asarray(det.bbox, dtype=np.float64) / page_render_scale)
+            for det in detections
         ]
-        det.bbox = adjusted_bbox
-        det.save()
-        saved_detections.append(det)
+    else:
+        rescaled = polys / page_render_scale
+
+    for det, bbox in zip(detections, rescaled):
+        det.bbox = bbox.tolist()
+
+    # One INSERT per batch instead of one per detection
+    saved_detections = Detection.objects.bulk_create(
+        detections, batch_size=500
+    )
+    for det in saved_detections:
         logger.debug(
-            f"[{det.config.name}] Saved detection ID {det.id} for page ID {det.page_id} with adjusted bbox: {det.bbox}"  # noqa E501
+            f"[{det.config_id}] Saved detection ID {det.id} for page ID {det.page_id} with adjusted bbox: {det.bbox}"  # noqa E501
         )
     return saved_detections
 
 
-def _create_page_in_db(document_id: int, page_number: int) -> Page:
+def _create_pages_in_db(document_id: int, num_pages: int) -> dict[int, int]:
     """
-    Create a Page object in the database for a given doc ID and page number.
-    If the Page object already exists, it will not be created again.
+    Make sure a Page object exists for every page of a document.
+
+    Existing pages are read in one query and the missing ones are inserted
+    with a single bulk_create, instead of a get_or_create per page.
 
     Args:
         document_id (int): The ID of the document.
-        page_number (int): The page number (0-indexed).
+        num_pages (int): The number of pages in the PDF.
 
     Returns:
-        Page: The Page object created or retrieved from the database.
+        dict[int, int]: Page IDs keyed by page number (1-indexed).
     """
-    page_db, created = Page.objects.get_or_create(
-        document_id=document_id, page_number=page_number
+    page_ids = dict(
+        Page.objects.filter(document_id=document_id).values_list(
+            "page_number", "id"
+        )
     )
 
-    if created:
+    new_pages = Page.objects.bulk_create(
+        Page(document_id=document_id, page_number=page_number)
+        for page_number in range(1, num_pages + 1)
+        if page_number not in page_ids
+    )
+    if new_pages:
         logger.info(
-            f"Created Page object for doc {document_id}, page {page_number}"
+            f"Created {len(new_pages)} Page objects for doc {document_id}"
         )
+    page_ids.update((page.page_number, page.id) for page in new_pages)
+
+    return page_ids
 
-    return page_db
+
+def _iter_page_images(pdf, page_render_scale: float, bitmap_maker=None):
+    """
+    Lazily render the pages of a PDF, closing each page as soon as it has
+    been rasterized, even if the consumer raises.
+
+    Args:
+        pdf (PdfDocument): The loaded pypdfium2 document.
+        page_render_scale (float): Scale factor for rendering the pages.
+        bitmap_maker (callable, optional): Bitmap maker passed through to
+            page_to_image.
+
+    Yields:
+        tuple[int, np.ndarray]: The page number (1-indexed) and page image.
+    """
+    for page_idx, page_obj in enumerate(pdf):
+        try:
+            page_im = page_to_image(
+                page_obj, page_render_scale, bitmap_maker=bitmap_maker
+            )
+        finally:
+            page_obj.close()
+        yield page_idx + 1, page_im
+
+
+def _prefetch_next(items):
+    """
+    Yield from an iterator while the next item is produced on a background
+    thread, so each page is rendered while the previous one is being OCR'd.
+
+    A single worker advances the iterator, so it is never driven from two
+    threads at once and pdfium is only ever called from one thread. Close
+    the generator before closing the underlying document: closing waits
+    for any in-flight render to finish.
+
+    Args:
+        items (Iterator): The iterator to read ahead of.
+
+    Yields:
+        The items of the iterator, in order.
+    """
+    done = object()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, items, done)
+        while True:
+            item = future.result()
+            if item is done:
+                return
+            future = executor.submit(next, items, done)
+            yield item
 
 
 def analyze_document(
     document_id: int,
-    # ocr,
     config_id: int,
     figure_kwargs: dict = None,
     table_kwargs: dict = None,
     boundary_preprocessing: bool = False,
+    backend: OcrBackend | None = None,
 ) -> list[Detection]:
     """
     Analyze a document by processing each page, extracting figure and table
@@ -221,12 +301,13 @@ def analyze_document(
 
     Args:
         document_id (int): The ID of the document to analyze.
-        #ocr (PaddleOCR): The configured OCR network.
         config_id (int): The ID of the OCRConfig object used.
         figure_kwargs (dict, optional): Arguments for figure extraction.
         table_kwargs (dict, optional): Arguments for table extraction.
         boundary_preprocessing (bool): Whether to perform figure/table boundary
             extraction. If False, processes the entire page image.
+        backend (OcrBackend, optional): The backend that runs OCR inference.
+            Defaults to the deployed modal function.
 
     Returns:
         list[Detection]: List of all saved detection objects for the document.
@@ -239,6 +320,8 @@ def analyze_document(
         figure_kwargs = {}
     if table_kwargs is None:
         table_kwargs = {}
+    if backend is None:
+        backend = ModalBackend()
 
     pdf = get_pdf_object(document_id)
     logger.info(
@@ -264,87 +347,59 @@ def analyze_document(
         )
         page_render_scale = 4.0
 
-    # Iterate through each page of the PDF
-    for page_idx, page_obj in enumerate(pdf):
-        page_number = page_idx + 1
-        logger.info(
-            f"[{config_id}] Processing page {page_number} for document {document_id}"  # noqa E501
-        )
+    # Render every page into one reusable buffer
+    bitmap_maker = make_reusable_bitmap_maker()
 
-        page_im = page_to_image(page_obj, page_render_scale)
+    # Iterate through each page of the PDF, rendering the next page while
+    # the current one is OCR'd. The page iterator is closed before the PDF.
+    page_images = _prefetch_next(
+        _iter_page_images(pdf, page_render_scale, bitmap_maker)
+    )
+    with closing(pdf), closing(page_images):
+        # Create every page in db up front
+        page_ids = _create_pages_in_db(document_id, len(pdf))
 
-        # Create page in db
-        try:
-            page_db = _create_page_in_db(document_id, page_number)
-        except Exception as e:
-            logger.error(
-                f"Error creating page in DB for doc {document_id}, page {page_number}: {e}",  # noqa E501
-                exc_info=True,
+        for page_number, page_im in page_images:
+            logger.info(
+                f"[{config_id}] Processing page {page_number} for document {document_id}"  # noqa E501
             )
-            continue
+            page_db_id = page_ids[page_number]
 
-        # Extract figure and table regions from the page image
-        if boundary_preprocessing:
-            figure_npd, table_npd, figure_offset, table_offset = (
-                figure_table_extraction(
+            # Find figure and table regions; the page is sent to the OCR
+            # backend once and cropped there
+            regions = None
+            if boundary_preprocessing:
+                regions = figure_table_regions(
                     page_im,
                     figure_kwargs=figure_kwargs,
                     table_kwargs=table_kwargs,
                 )
-            )
-
-            logger.info("Gathering detections for figures and tables...")
-            figure_dets = _extract_detections_from_image(
-                figure_npd,
-                # ocr,
-                paddle_params,
-                config_id,
-                page_db.id,
-            )
-            table_dets = _extract_detections_from_image(
-                table_npd,
-                # ocr,
-                paddle_params,
-                config_id,
-                page_db.id,
-            )
-
-            # Adjust and save detections
-            _adjust_and_save_detections(
-                figure_dets,
-                figure_offset[0],
-                figure_offset[1],
-                page_render_scale,
-            )
+                if regions:
+                    logger.info(
+                        "Gathering detections for figures and tables..."
+                    )
+                else:
+                    logger.warning(
+                        "No figure/table regions found; processing entire "
+                        "page image."
+                    )
+                    regions = None
+            else:
+                logger.info(
+                    "Processing entire page image without boundary "
+                    "extraction..."
+                )
 
-            _adjust_and_save_detections(
-                table_dets,
-                table_offset[0],
-                table_offset[1],
-                page_render_scale,
-            )
-        else:
-            logger.info(
-                "Processing entire page image without boundary extraction..."
-            )
             page_dets = _extract_detections_from_image(
                 page_im,
-                # ocr,
+                backend,
                 paddle_params,
                 config_id,
-                page_db.id,
-            )
-
-            # Adjust and save detections with no offset
-            _adjust_and_save_detections(
-                page_dets,
-                0,  # No x offset
-                0,  # No y offset
-                page_render_scale,
+                page_db_id,
+                regions=regions,
             )
 
-        page_obj.close()
-
-    pdf.close()
+            # Rescale and save detections
+            _adjust_and_save_detections(page_dets, page_render_scale)
 
     logger.info(f"[{param_config_name}] Completed document {document_id}. ")
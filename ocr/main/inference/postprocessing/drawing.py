@@ -1,5 +1,11 @@
+import os
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pymupdf
 from django.conf import settings
 from loguru import logger
@@ -7,39 +13,82 @@ from loguru import logger
 from ocr.main.utils.pdf_utils import get_pdf_object
 from ocr.models import Page, Tag
 
+# Annotated pages are previews for review; JPEG at this quality keeps the
+# red boxes and labels legible while encoding much faster than PNG.
+JPEG_QUALITY = 85
 
-def _load_pdf_and_rotate(document_id: int) -> list[pymupdf.Page]:
+# Tag labels sit this far above their box, but never closer to the top
+# edge of the page than the minimum (both in PDF points)
+TEXT_Y_OFFSET_POINTS = 5
+TEXT_MIN_Y_FROM_TOP_POINTS = 5
+
+
+def _load_pdf_and_rotate(document_id: int) -> Iterator[pymupdf.Page]:
     """
     Load the PDF document WITHOUT rotating it.
 
+    Pages are yielded one at a time so only the page being drawn is loaded,
+    and the document is closed once every page has been consumed.
+
     Args:
         document_id (int): The ID of the document.
 
-    Returns:
-        list[pymupdf.Page]: The loaded PDF document pages.
+    Yields:
+        pymupdf.Page: The loaded PDF document pages, in order.
     """
     pdf = get_pdf_object(document_id, pdf_lib="pymupdf")
 
     # Return pages without rotation to maintain coordinate consistency
     # The OCR was performed on rotated pages, but we need to account for this
     # in our coordinate transformation instead of rotating the output pages
-    return list(pdf)
+    try:
+        yield from pdf
+    finally:
+        pdf.close()
+
+
+def _unrotate_points(points: np.ndarray, page: pymupdf.Page) -> np.ndarray:
+    """
+    Map points from the rotated page frame back to the unrotated frame.
+
+    The inverse rotation matrix is read once per page and applied to all
+    points in a single row-vector affine transform: p' = p @ A + t.
+
+    Args:
+        points (np.ndarray): Array of points with shape (..., 2).
+        page (pymupdf.Page): The page whose rotation is undone.
+
+    Returns:
+        np.ndarray: The transformed points, same shape as the input.
+    """
+    # Unrotated pages have an identity rotation matrix; skip the matmul
+    if page.rotation == 0:
+        return points
+
+    inv = ~page.rotation_matrix
+    inv_linear = np.array([[inv.a, inv.b], [inv.c, inv.d]])
+    inv_translation = np.array([inv.e, inv.f])
+    return points @ inv_linear + inv_translation
 
 
 def _draw_bboxes_on_page(
-    document_id: int,
+    tags: list[Tag],
     page: pymupdf.Page,
     page_obj: Page,
     config_id: int,
     render_scale: float = 2.0,
 ):
     """
-    Draw bounding boxes for detections on a specific page.
-    """
-    # Get detections for this page and config
-    tags = Tag.objects.filter(document_id=document_id)
+    Draw bounding boxes for the given tags on a specific page.
 
-    if not tags.exists():
+    Args:
+        tags (list[Tag]): The tags on this page, preloaded by the caller.
+        page (pymupdf.Page): The PyMuPDF page to draw on.
+        page_obj (Page): The matching Page model instance.
+        config_id (int): The OCR config ID.
+        render_scale (float): Scale factor the page will be rendered at.
+    """
+    if not tags:
         logger.info(f"No tags found for page {page_obj.page_number}")
         return
 
@@ -51,50 +100,31 @@ def _draw_bboxes_on_page(
     )
     logger.info(f"Render scale: {render_scale}")
 
-    page_intrinsic_rotation = page.rotation
-    text_render_rotation = page_intrinsic_rotation
-    inv_rotation_matrix = ~page.rotation_matrix
-
-    for i, tag in enumerate(tags):
-        bbox_points = tag.bbox
-
-        polygon_vertices_unrotated_pdf = []
-        for p_rot_coords in bbox_points:
-            pt_in_rotated_frame = pymupdf.Point(
-                p_rot_coords[0], p_rot_coords[1]
-            )
-            pt_in_unrotated_frame = pt_in_rotated_frame * inv_rotation_matrix
-            polygon_vertices_unrotated_pdf.append(pt_in_unrotated_frame)
+    text_render_rotation = page.rotation
 
-        x_coords_unrot = [p.x for p in polygon_vertices_unrotated_pdf]
-        y_coords_unrot = [p.y for p in polygon_vertices_unrotated_pdf]
+    # Un-rotate every tag's points at once; shape (N, 4, 2) at original scale
+    bbox_points = np.asarray([tag.bbox for tag in tags], dtype=np.float64)
+    points_unrotated = _unrotate_points(bbox_points, page)
+    rect_mins = points_unrotated.min(axis=1)
+    rect_maxs = points_unrotated.max(axis=1)
 
-        # Get min/max from bbox (coordinates at original scale)
-        x_coords_unrot = [p.x for p in polygon_vertices_unrotated_pdf]
-        y_coords_unrot = [p.y for p in polygon_vertices_unrotated_pdf]
+    # One shape for the whole page: every rect and label is buffered and
+    # committed to the page contents in a single operation.
+    shape = page.new_shape()
 
-        rect_x1 = min(x_coords_unrot)
-        rect_y1 = min(y_coords_unrot)
-        rect_x2 = max(x_coords_unrot)
-        rect_y2 = max(y_coords_unrot)
-
-        drawn_rect = pymupdf.Rect(rect_x1, rect_y1, rect_x2, rect_y2)
-        page.draw_rect(drawn_rect, color=(1, 0, 0), width=1)
-
-        min_x_for_text = min(x_coords_unrot) if x_coords_unrot else 0
-        min_y_for_text = min(y_coords_unrot) if y_coords_unrot else 0
+    for i, (tag, (rect_x1, rect_y1), (rect_x2, rect_y2)) in enumerate(
+        zip(tags, rect_mins, rect_maxs)
+    ):
+        shape.draw_rect(pymupdf.Rect(rect_x1, rect_y1, rect_x2, rect_y2))
 
         # Add text label above the bbox
         if tag.text and len(tag.text.strip()) > 0:
-            text_y_offset_points = 5
-            text_min_y_from_top_points = 5
-
-            text_anchor_y = min_y_for_text - text_y_offset_points
-            text_anchor_y = max(text_anchor_y, text_min_y_from_top_points)
+            text_anchor_y = rect_y1 - TEXT_Y_OFFSET_POINTS
+            text_anchor_y = max(text_anchor_y, TEXT_MIN_Y_FROM_TOP_POINTS)
 
-            actual_text_point = pymupdf.Point(min_x_for_text, text_anchor_y)
+            actual_text_point = pymupdf.Point(rect_x1, text_anchor_y)
             # Fontsize 8 is also in PDF points.
-            page.insert_text(
+            shape.insert_text(
                 actual_text_point,
                 f"{i}: {tag.text[:15]}",
                 fontsize=8,
@@ -102,8 +132,95 @@ def _draw_bboxes_on_page(
                 rotate=text_render_rotation,
             )
 
+    shape.finish(color=(1, 0, 0), width=1)
+    shape.commit(overlay=True)
 
-def visualize_document_results(document_id: int, config_id: int) -> list[str]:
+
+def _write_page_image(output_path: Path, image_bytes: bytes) -> None:
+    """
+    Write an encoded page image to disk and log the outcome.
+
+    Plain file I/O only, so it is safe to run off the main thread. The
+    image is written to a temporary file beside the destination and moved
+    into place, so an interrupted write never leaves a truncated image that
+    _is_image_current would later reuse.
+
+    Args:
+        output_path (Path): Destination path of the image file.
+        image_bytes (bytes): The encoded image data.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(image_bytes)
+        # mkstemp creates files readable by the owner only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    # Verify file was created
+    if output_path.exists():
+        logger.info(f"Successfully saved image to {output_path}")
+    else:
+        logger.error(f"Failed to save image to {output_path}")
+
+
+def _is_image_current(output_path: Path, latest_tag_time) -> bool:
+    """
+    Check whether a previously rendered page image can be reused.
+
+    Args:
+        output_path (Path): Path of the annotated page image.
+        latest_tag_time (datetime | None): Creation time of the newest tag
+            in the document, or None if the document has no tags.
+
+    Returns:
+        bool: True if the image exists and is newer than every tag.
+    """
+    if latest_tag_time is None or not output_path.exists():
+        return False
+    return output_path.stat().st_mtime > latest_tag_time.timestamp()
+
+
+def _render_one_page(
+    tags: list[Tag],
+    pdf_page: pymupdf.Page,
+    django_page: Page,
+    config_id: int,
+    render_scale: float,
+    render_matrix: pymupdf.Matrix,
+) -> bytes:
+    """
+    Draw the tags on a page and render it to JPEG bytes.
+
+    Args:
+        tags (list[Tag]): The tags to draw on this page.
+        pdf_page (pymupdf.Page): The PyMuPDF page to draw on.
+        django_page (Page): The matching Page model instance.
+        config_id (int): The OCR config ID.
+        render_scale (float): Scale factor for the rendered image.
+        render_matrix (pymupdf.Matrix): Scaling matrix for render_scale,
+            built once per document by the caller.
+
+    Returns:
+        bytes: The annotated page encoded as JPEG.
+    """
+    # Draw bounding boxes on the page
+    _draw_bboxes_on_page(tags, pdf_page, django_page, config_id, render_scale)
+
+    # Convert page to image with the same scale used for drawing
+    # No alpha channel: the preview is opaque, and RGB encodes faster
+    pix = pdf_page.get_pixmap(matrix=render_matrix, alpha=False)
+    return pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY)
+
+
+def visualize_document_results(
+    document_id: int, config_id: int
+) -> dict[int, str]:
     """
     Create annotated images for all pages of a document with OCR results.
 
@@ -112,15 +229,41 @@ def visualize_document_results(document_id: int, config_id: int) -> list[str]:
         config_id (int): The OCR config ID.
 
     Returns:
-        list[str]: List of file paths to the generated images.
+        dict[int, str]: Relative paths of the generated images, keyed by
+            page number. PDF pages without a Page row are skipped, and
+            pages whose image is newer than the document's tags are not
+            re-rendered.
     """
     # Use a consistent render scale - we'll use 2x for good quality
     render_scale = 2
+    render_matrix = pymupdf.Matrix(render_scale, render_scale)
 
     # Load PDF and get pages
     pdf_pages = _load_pdf_and_rotate(document_id)
-    django_pages = Page.objects.filter(document_id=document_id).order_by(
-        "page_number"
+    # Page rows keyed by page number, so each PDF page is matched to its
+    # own row even if rows are missing. page_number is not a unique field,
+    # which rules out in_bulk(field_name="page_number").
+    pages_by_number = {
+        page.page_number: page
+        for page in Page.objects.filter(document_id=document_id)
+    }
+
+    # Load every tag for the document in one query, keyed by page number,
+    # instead of querying once per page while drawing.
+    tags_by_page = defaultdict(list)
+    document_tags = (
+        Tag.objects.filter(document_id=document_id)
+        .only("id", "bbox", "text", "page_number", "created_at")
+        .order_by("page_number", "id")
+    )
+    for tag in document_tags:
+        tags_by_page[tag.page_number].append(tag)
+
+    # Postprocessing replaces all of a document's tags at once, so the
+    # newest tag marks the last time any page's drawing could have changed.
+    latest_tag_time = max(
+        (tag.created_at for tags in tags_by_page.values() for tag in tags),
+        default=None,
     )
 
     # Create output directory
@@ -132,34 +275,47 @@ def visualize_document_results(document_id: int, config_id: int) -> list[str]:
     )
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    generated_files = []
-
-    for pdf_page, django_page in zip(pdf_pages, django_pages):
-        # Draw bounding boxes on the page
-        _draw_bboxes_on_page(
-            document_id, pdf_page, django_page, config_id, render_scale
-        )
-
-        # Convert page to image with the same scale used for drawing
-        pix = pdf_page.get_pixmap(
-            matrix=pymupdf.Matrix(render_scale, render_scale)
-        )
-
-        # Save as PNG
-        output_filename = f"page_{django_page.page_number}_annotated.png"
-        output_path = output_dir / output_filename
-        pix.save(str(output_path))
-
-        # Verify file was created
-        if output_path.exists():
-            logger.info(f"Successfully saved image to {output_path}")
-        else:
-            logger.error(f"Failed to save image to {output_path}")
-
-        # Store relative path for URL generation
-        relative_path = (
-            f"ocr_results/{document_id}/{config_id}/{output_filename}"
-        )
-        generated_files.append(relative_path)
+    generated_files = {}
+
+    # PyMuPDF is not thread safe, so drawing and rendering stay on this
+    # thread; writing the encoded images to disk overlaps with the next
+    # page's render instead of blocking it.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        writes = []
+        for page_number, pdf_page in enumerate(pdf_pages, start=1):
+            django_page = pages_by_number.get(page_number)
+            if django_page is None:
+                logger.warning(f"No Page row for page {page_number}")
+                continue
+
+            output_filename = f"page_{django_page.page_number}_annotated.jpg"
+            output_path = output_dir / output_filename
+
+            if _is_image_current(output_path, latest_tag_time):
+                logger.info(f"Reusing up-to-date image {output_path}")
+            else:
+                image_bytes = _render_one_page(
+                    tags_by_page.get(django_page.page_number, []),
+                    pdf_page,
+                    django_page,
+                    config_id,
+                    render_scale,
+                    render_matrix,
+                )
+                writes.append(
+                    executor.submit(
+                        _write_page_image, output_path, image_bytes
+                    )
+                )
+
+            # Store relative path for URL generation
+            relative_path = (
+                f"ocr_results/{document_id}/{config_id}/{output_filename}"
+            )
+            generated_files[page_number] = relative_path
+
+        # Surface any write error before the paths are handed back
+        for write in writes:
+            write.result()
 
     return generated_files
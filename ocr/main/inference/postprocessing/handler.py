@@ -1,11 +1,10 @@
 from loguru import logger
 
 from ocr.main.inference.postprocessing.pipeline_steps import (
+    filter_tags,
     merge_touching_detections,
-    remove_numeric_only_tags,
-    remove_single_character_detections,
 )
-from ocr.models import Detection, Tag
+from ocr.models import Detection, Document, Tag
 
 
 def _handle_no_detections():
@@ -17,9 +16,14 @@ def _handle_no_detections():
     return None
 
 
-def _save_tags(tag_data: list[tuple[Tag, list[Detection]]]):
+def _save_tags(
+    tag_data: list[tuple[Tag, list[Detection]]], document: Document
+):
     """
-    Save the tags to the database.
+    Save the tags to the database and link their detections.
+
+    All tags are inserted with one bulk_create and all detections are
+    re-pointed with one bulk_update, inside a single transaction.
     """
     from django.db import transaction
 
@@ -27,19 +31,44 @@ def _save_tags(tag_data: list[tuple[Tag, list[Detection]]]):
         logger.info("No tags to save.")
         return
 
-    for tag, detections in tag_data:
-        try:
-            with transaction.atomic():
-                tag.resolve_is_equipment_tag()
-                tag.save()
+    tags = []
+    tagged_detections = []
+    for tag, _ in tag_data:
+        tag.resolve_is_equipment_tag()
+        tags.append(tag)
+
+    try:
+        with transaction.atomic():
+            # bulk_create sets the primary keys on the tag instances
+            Tag.objects.bulk_create(tags, batch_size=200)
+            for tag, detections in tag_data:
                 for detection in detections:
                     detection.tag = tag
-                    detection.save(update_fields=["tag"])
-                logger.info(
-                    f"Saved tag: {tag.text} for document {tag.document.name}"
-                )
-        except Exception as e:
-            logger.error(f"Error saving tag {tag.id}: {e}")
+                    tagged_detections.append(detection)
+            Detection.objects.bulk_update(
+                tagged_detections, ["tag"], batch_size=500
+            )
+    except Exception as e:
+        logger.error(
+            f"Error saving {len(tags)} tags for document {document.name}: {e}"
+        )
+        return
+
+    logger.info(
+        f"Saved {len(tags)} tags covering {len(tagged_detections)} "
+        f"detections for document {document.name}"
+    )
+
+
+def _delete_existing_tags(document_id: int):
+    """
+    Delete all existing tags for the document.
+
+    Detection.tag is SET_NULL, so the deletion collector loads the tags,
+    unlinks their detections with one UPDATE and removes the tags with one
+    DELETE.
+    """
+    Tag.objects.filter(document_id=document_id).delete()
 
 
 def run_postprocessing_pipeline(document_id: int):
@@ -47,25 +76,40 @@ def run_postprocessing_pipeline(document_id: int):
     Placeholder for the postprocessing pipeline.
     """
     logger.info(f"Running postprocessing pipeline for document {document_id}")
-    detections: list[Detection] = Detection.objects.filter(
-        page__document_id=document_id
-    )
+    detections = Detection.objects.filter(page__document_id=document_id)
 
-    # Delete all existing tags for the document
-    Tag.objects.filter(document_id=document_id).delete()
+    _delete_existing_tags(document_id)
 
     if not detections.exists():
         return _handle_no_detections()
 
-    tag_det_data = merge_touching_detections(detections)
-    tag_det_data = remove_single_character_detections(tag_det_data)
-    tag_det_data = remove_numeric_only_tags(tag_det_data)
+    document = Document.objects.get(pk=document_id)
+    # Stream the detections page by page with only the columns the
+    # pipeline reads, instead of materializing every row up front.
+    detection_stream = (
+        detections.select_related("page")
+        .only(
+            "id",
+            "bbox",
+            "text",
+            "confidence",
+            "page_id",
+            "page__page_number",
+            "page__document_id",
+        )
+        .order_by("page_id", "id")
+        .iterator(chunk_size=2000)
+    )
+    tag_det_data = merge_touching_detections(
+        detection_stream, document=document
+    )
+    tag_det_data = filter_tags(tag_det_data)
 
     # Removed due to lack of manpower to build dictionary of words
     # for spell checking. To add back in the future you need to readd
     # pyspellchecker to pyproject.toml and uncomment the line below.
     # Then go to pipeline_steps.py and uncomment the helper functions
-    # in that file
+    # in that file. It must run on the output of filter_tags.
     # tag_det_data = spell_check_tags(tag_det_data)
 
-    return _save_tags(tag_det_data)
+    return _save_tags(tag_det_data, document)
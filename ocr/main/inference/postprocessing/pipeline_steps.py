@@ -1,20 +1,285 @@
 import re
-from collections import defaultdict, deque
+from collections.abc import Iterable
+from itertools import groupby
+from operator import attrgetter
 
+import numpy as np
 from loguru import logger
 
 from ocr.models import Tag
 
+# from functools import lru_cache
 # from spellchecker import SpellChecker
 
+# EXX tags ("E" and two digits) optionally wrapped in brackets or slashes
+_EXX_TAG_RE = re.compile(r"^[()\[\]/\\]*E\d{2}[()\[\]/\\]*$")
+
+# Translation table deleting brackets and slashes from words
+_REMOVE_CHARS_TABLE = str.maketrans("", "", "(){}[]\\/")
+
+# Any ASCII letter, for the fast path of _is_numeric_only
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
 
 def _get_bbox_extremes(bbox_points: list) -> tuple[float, float, float, float]:
     """Calculates min/max x/y coordinates from bbox points."""
-    x_coords = [p[0] for p in bbox_points]
-    y_coords = [p[1] for p in bbox_points]
-    if not x_coords or not y_coords:  # Should not happen for valid bboxes
+    if not bbox_points:  # Should not happen for valid bboxes
         return 0, 0, 0, 0
-    return min(x_coords), min(y_coords), max(x_coords), max(y_coords)
+
+    try:
+        points = np.asarray(bbox_points, dtype=np.float64)
+    except ValueError:
+        points = None
+
+    if points is None or points.ndim != 2 or points.shape[1] < 2:
+        # Malformed points, read the first two values of each one
+        x_coords = [p[0] for p in bbox_points]
+        y_coords = [p[1] for p in bbox_points]
+        return min(x_coords), min(y_coords), max(x_coords), max(y_coords)
+
+    # One reduction per axis for all four extremes
+    x_min, y_min = points[:, :2].min(axis=0).tolist()
+    x_max, y_max = points[:, :2].max(axis=0).tolist()
+    return x_min, y_min, x_max, y_max
+
+
+def _sweep_windows(
+    lo: np.ndarray, hi: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sort intervals by their start and size each one's sweep window.
+
+    Args:
+        lo (np.ndarray): Start of each interval.
+        hi (np.ndarray): End of each interval.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The sort order, and for each sorted
+            interval the number of following intervals that start no
+            further than its end.
+    """
+    order = np.argsort(lo, kind="stable")
+    sorted_lo = lo[order]
+    window_ends = np.searchsorted(sorted_lo, hi[order], side="right")
+    positions = np.arange(len(lo))
+    return order, np.maximum(window_ends - positions - 1, 0)
+
+
+def _overlapping_pairs(ext: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find all pairs of boxes whose extents overlap, using sort and sweep.
+
+    Boxes are sorted by their leading edge on one axis. Each box can then
+    only overlap the boxes that follow it in that order and start no
+    further along than its own trailing edge, so only that window is
+    tested on the other axis instead of every other box on the page. All
+    windows are expanded and tested at once, without a Python loop.
+
+    Both axes are sized first and the sweep runs along the one with fewer
+    candidates, so pages of wide boxes stacked in rows are swept
+    vertically rather than degrading towards every pair.
+
+    Args:
+        ext (np.ndarray): Array of shape (N, 4) of box extremes as
+            (x_min, y_min, x_max, y_max).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Indices into ``ext`` of the first
+            and second box of each overlapping pair.
+    """
+    x_order, x_windows = _sweep_windows(ext[:, 0], ext[:, 2])
+    y_order, y_windows = _sweep_windows(ext[:, 1], ext[:, 3])
+    if y_windows.sum() < x_windows.sum():
+        # Sweep along y, test overlap on x
+        order, window_sizes, cross_axis = y_order, y_windows, (0, 2)
+    else:
+        order, window_sizes, cross_axis = x_order, x_windows, (1, 3)
+    cross_min = ext[order, cross_axis[0]]
+    cross_max = ext[order, cross_axis[1]]
+
+    # Expand every window into explicit (left, right) candidate pairs;
+    # overlap on the sweep axis is implied within the window
+    positions = np.arange(len(ext))
+    left = np.repeat(positions, window_sizes)
+    window_starts = np.repeat(
+        np.cumsum(window_sizes) - window_sizes, window_sizes
+    )
+    right = left + 1 + (np.arange(len(left)) - window_starts)
+
+    cross_overlap = (cross_min[right] <= cross_max[left]) & (
+        cross_max[right] >= cross_min[left]
+    )
+    return order[left[cross_overlap]], order[right[cross_overlap]]
+
+
+def _component_labels(
+    num_boxes: int, first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    """
+    Label the connected components of a graph given as an edge list.
+
+    Every node starts labelled with its own index. Each round hooks both
+    ends of every edge to the smaller of their labels, then compresses
+    label chains by pointer jumping, until nothing changes. All work is
+    done in NumPy.
+
+    Args:
+        num_boxes (int): Number of nodes.
+        first (np.ndarray): First node of each edge.
+        second (np.ndarray): Second node of each edge.
+
+    Returns:
+        np.ndarray: The label of each node, which is the lowest node index
+            in its component.
+    """
+    labels = np.arange(num_boxes)
+    # Pages where no boxes overlap are common; every box is its own label
+    if len(first) == 0:
+        return labels
+
+    while True:
+        previous = labels.copy()
+        np.minimum.at(labels, first, labels[second])
+        np.minimum.at(labels, second, labels[first])
+
+        # Pointer jumping: follow label chains to their root
+        jumped = labels[labels]
+        while not np.array_equal(jumped, labels):
+            labels = jumped
+            jumped = labels[labels]
+
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def _page_components(ext: np.ndarray) -> list[list[int]]:
+    """
+    Group a page's boxes into connected components of overlapping boxes.
+
+    Args:
+        ext (np.ndarray): Array of shape (N, 4) of box extremes as
+            (x_min, y_min, x_max, y_max).
+
+    Returns:
+        list[list[int]]: Box indices of each component, top-most box first
+            and left-most first among boxes with the same top edge.
+            Components are ordered by their lowest box index.
+    """
+    num_boxes = len(ext)
+    if num_boxes == 0:
+        return []
+    labels = _component_labels(num_boxes, *_overlapping_pairs(ext))
+
+    # A stable sort by label puts each component's boxes together in index
+    # order, and orders components by their lowest box index
+    by_label = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[by_label])) + 1
+
+    # Members read top to bottom; boxes sharing a top edge read left to
+    # right, then in index order
+    reading_order = list(zip(ext[:, 1].tolist(), ext[:, 0].tolist()))
+    components = []
+    for members in np.split(by_label, boundaries):
+        component_indices = members.tolist()
+        component_indices.sort(key=reading_order.__getitem__)
+        components.append(component_indices)
+    return components
+
+
+def _build_page_tags(
+    page_detections: list,
+    ext: np.ndarray,
+    components: list[list[int]],
+    document_instance,
+    page_number: int,
+) -> list[tuple]:
+    """
+    Create one Tag per component of a page's detections.
+
+    Args:
+        page_detections (list): List of Detection objects for a single page.
+        ext (np.ndarray): Array of shape (N, 4) of the detections' extremes.
+        components (list[list[int]]): Detection indices of each component,
+            as returned by _page_components.
+        document_instance (Document): The Document instance.
+        page_number (int): The page number of the document (1-indexed).
+
+    Returns:
+        list: List of tuples containing Tag objects and their detections.
+    """
+    if not components:
+        return []
+
+    # The merged box spans the extremes of its members. Components are laid
+    # end to end so every box is reduced in one pass per side.
+    members = np.concatenate(components)
+    starts = np.cumsum([0] + [len(c) for c in components[:-1]])
+    merged_lo = np.minimum.reduceat(ext[members, :2], starts).tolist()
+    merged_hi = np.maximum.reduceat(ext[members, 2:], starts).tolist()
+
+    # Tags keep the lowest confidence of their members. float64 so the
+    # stored values match the detections' exactly.
+    confidences = np.fromiter(
+        (d.confidence for d in page_detections),
+        dtype=np.float64,
+        count=len(page_detections),
+    )
+    min_confs = np.minimum.reduceat(confidences[members], starts).tolist()
+
+    page_tag_data = []
+    for component_indices, (x_lo, y_lo), (x_hi, y_hi), min_conf in zip(
+        components, merged_lo, merged_hi, min_confs
+    ):
+        comp_dets = [page_detections[k] for k in component_indices]
+
+        merged_text = " ".join([d.text for d in comp_dets])
+
+        merged_bbox = [
+            [x_lo, y_lo],
+            [x_hi, y_lo],
+            [x_hi, y_hi],
+            [x_lo, y_hi],
+        ]
+
+        # Assuming Tag class is available globally or imported
+        # And that Document model is also available for Tag's FK
+        tag = Tag(
+            document=document_instance,
+            page_number=page_number,
+            text=merged_text,
+            bbox=merged_bbox,
+            algorithm="proximity_merge",
+            confidence=min_conf,
+        )
+        page_tag_data.append((tag, comp_dets))
+    return page_tag_data
+
+
+def _page_extremes(page_detections: list) -> np.ndarray:
+    """
+    Stack the bbox extremes of a page's detections into an (N, 4) array.
+
+    The bboxes are laid out once as separate x and y columns, so each of
+    the four extremes is a single reduction over the whole page.
+    """
+    try:
+        points = np.asarray(
+            [det.bbox for det in page_detections], dtype=np.float64
+        )
+    except ValueError:
+        points = None
+
+    if points is None or points.ndim != 3 or points.shape[2] != 2:
+        # Ragged or malformed bboxes, fall back to one detection at a time
+        det_extremes = [
+            _get_bbox_extremes(det.bbox) for det in page_detections
+        ]
+        return np.asarray(det_extremes, dtype=np.float64).reshape(-1, 4)
+
+    xs, ys = points[:, :, 0], points[:, :, 1]
+    return np.column_stack(
+        (xs.min(axis=1), ys.min(axis=1), xs.max(axis=1), ys.max(axis=1))
+    )
 
 
 def _process_page_detections(
@@ -25,7 +290,9 @@ def _process_page_detections(
     """
     Processes detections for a single page to find and create Tags.
 
-    Uses BFS to find connected components based on bounding box overlaps.
+    Overlapping pairs are found with a sort-and-sweep over the bounding
+    boxes, and detections are grouped into connected components by
+    propagating the minimum label along those pairs.
 
     Args:
         page_detections (list): List of Detection objects for a single page.
@@ -38,67 +305,19 @@ def _process_page_detections(
     if not page_detections:
         return []
 
-    num_dets = len(page_detections)
-    adj = defaultdict(list)
-    det_extremes = [_get_bbox_extremes(det.bbox) for det in page_detections]
-
-    for i in range(num_dets):
-        for j in range(i + 1, num_dets):
-            x_min1, y_min1, x_max1, y_max1 = det_extremes[i]
-            x_min2, y_min2, x_max2, y_max2 = det_extremes[j]
-
-            horizontal_overlap = x_min1 <= x_max2 and x_max1 >= x_min2
-            vertical_overlap = y_min1 <= y_max2 and y_max1 >= y_min2
-
-            if horizontal_overlap and vertical_overlap:
-                adj[i].append(j)
-                adj[j].append(i)
-
-    visited = [False] * num_dets
-    page_tag_data = []
-    for i in range(num_dets):
-        if not visited[i]:
-            component_indices = []
-            q = deque([i])
-            visited[i] = True
-            while q:
-                u_idx = q.popleft()
-                component_indices.append(u_idx)
-                for v_idx in adj[u_idx]:
-                    if not visited[v_idx]:
-                        visited[v_idx] = True
-                        q.append(v_idx)
-
-            comp_dets = [page_detections[k] for k in component_indices]
-            comp_dets.sort(key=lambda d: _get_bbox_extremes(d.bbox)[1])
-
-            merged_text = " ".join([d.text for d in comp_dets])
-
-            all_x = [p[0] for det in comp_dets for p in det.bbox]
-            all_y = [p[1] for det in comp_dets for p in det.bbox]
-            merged_bbox = [
-                [min(all_x), min(all_y)],
-                [max(all_x), min(all_y)],
-                [max(all_x), max(all_y)],
-                [min(all_x), max(all_y)],
-            ]
-            min_conf = min(d.confidence for d in comp_dets)
-
-            # Assuming Tag class is available globally or imported
-            # And that Document model is also available for Tag's FK
-            tag = Tag(
-                document=document_instance,
-                page_number=page_number,
-                text=merged_text,
-                bbox=merged_bbox,
-                algorithm="proximity_merge",
-                confidence=min_conf,
-            )
-            page_tag_data.append((tag, comp_dets))
-    return page_tag_data
+    ext = _page_extremes(page_detections)
+    return _build_page_tags(
+        page_detections,
+        ext,
+        _page_components(ext),
+        document_instance,
+        page_number,
+    )
 
 
-def merge_touching_detections(detections: list) -> list[tuple]:
+def merge_touching_detections(
+    detections: Iterable, document=None
+) -> list[tuple]:
     """
     Merge detections with overlapping bounding boxes into
     a single 'tag' detection.
@@ -108,7 +327,8 @@ def merge_touching_detections(detections: list) -> list[tuple]:
     whose bounding boxes top and bottom edges overlap with another
     detection's bounding box top and bottom edges. The text data of the
     detections will be concatenated into a single string and it will
-    be organized starting with the top-most detection.
+    be organized starting with the top-most detection. Detections that
+    share a top edge are read left to right.
 
     It is important to note that more than two detections may be stacked
     vertically. For example if 3 detections are stacked vertically, the
@@ -116,30 +336,34 @@ def merge_touching_detections(detections: list) -> list[tuple]:
     detection should link the top and bottom detections together.
 
     Args:
-        detections (list): List of Detection objects to be merged.
+        detections (Iterable): Detection objects to be merged, ordered by
+            page. May be a lazy iterator such as ``QuerySet.iterator()``;
+            only one page of detections is held at a time.
+        document (Document, optional): The document all detections belong
+            to. Set on every tag so it is not re-fetched per page.
 
     Returns:
         list[tuple]: List of new tag objects with detection composition data.
     """
-    if not detections:
-        return []
-
-    # Group detections by page_id (using Detection.page.id)
-    page_groups = defaultdict(list)
-    for det in detections:
-        page_groups[det.page.id].append(det)
-
     tag_data_with_detections = []
-    for page_id in page_groups:
-        current_page_detections = page_groups[page_id]
-        if not current_page_detections:
-            continue
+    # Documents looked up from pages when none is given, keyed by ID, so
+    # each document is fetched once rather than once per page
+    documents_by_id = {}
+
+    # Detections arrive ordered by page, so consecutive runs share a page
+    for _, page_dets in groupby(detections, key=attrgetter("page_id")):
+        current_page_detections = list(page_dets)
 
         # All detections on a page share the same Page instance and Document
         # and page number.
-        doc_instance = current_page_detections[0].page.document
+        page = current_page_detections[0].page
+        doc_instance = document
+        if doc_instance is None:
+            if page.document_id not in documents_by_id:
+                documents_by_id[page.document_id] = page.document
+            doc_instance = documents_by_id[page.document_id]
         # Assuming Page model has 'page_number' attribute (1-indexed for Tag)
-        p_number = current_page_detections[0].page.page_number
+        p_number = page.page_number
 
         tags_for_page = _process_page_detections(
             current_page_detections, doc_instance, p_number
@@ -149,55 +373,64 @@ def merge_touching_detections(detections: list) -> list[tuple]:
     return tag_data_with_detections
 
 
-def remove_single_character_detections(
-    tag_det_data: list[tuple],
-) -> list[tuple]:
+def _is_single_character(text: str) -> bool:
     """
-    Remove tags that consist of a single character
+    Check whether the text is a single character.
     """
-    logger.info("Removing single character tags from the merged tag data.")
-
-    new_data = []
-
-    for tag, det in tag_det_data:
-        if len(tag.text) == 1:
-            # Log the removal of single character tags
-            logger.info(
-                f"Removing tag: {tag.text} on page {tag.page_number} \\"
-                "Reason: Single character tag"
-            )
-            continue
-        else:
-            new_data.append((tag, det))
-
-    return new_data
+    return len(text) == 1
 
 
-def remove_numeric_only_tags(
-    tag_det_data: list[tuple],
-) -> list[tuple]:
+def _is_numeric_only(text: str) -> bool:
     """
-    Remove tags that consist of numeric characters only.
+    Check whether the text lacks any alphabetic characters.
 
     This includes tags that are purely digits and also tags where there
     are spaces between digits, such as "123 456". Or if there are special
     characters, punctuation, or symbols, such as "123.456". These symbols
     might be the degree symbol, percent sign, bracket }, or similar.
     """
-    logger.info("Removing numeric-only tags from the merged tag data.")
+    # Tag text is almost always ASCII, where a compiled search is exact and
+    # avoids a Python-level loop over every character
+    if text.isascii():
+        return _ASCII_LETTER_RE.search(text) is None
+    return not any(char.isalpha() for char in text)
+
+
+def filter_tags(tag_det_data: list[tuple]) -> list[tuple]:
+    """
+    Remove single character and numeric-only tags in a single pass.
+
+    Each tag is checked against every rejection rule in turn and dropped on
+    the first rule it fails, so the tag list is only traversed and rebuilt
+    once.
+
+    Args:
+        tag_det_data (list[tuple]): List of tuples containing Tag objects and
+                                    their associated detections.
+
+    Returns:
+        list[tuple]: The tuples whose tags passed every rule.
+    """
+    logger.info("Removing single character and numeric-only tags.")
 
     new_data = []
 
     for tag, det in tag_det_data:
-        # Check if the tag text contains any alphabetic characters
-        if not any(char.isalpha() for char in tag.text):
+        if _is_single_character(tag.text):
+            logger.info(
+                f"Removing tag: {tag.text} on page {tag.page_number} "
+                "Reason: Single character tag"
+            )
+            continue
+
+        if _is_numeric_only(tag.text):
             logger.info(
                 f"Removing numeric-only tag: {tag.text} on "
                 f"page {tag.page_number} Reason: Tag lacks alphabetic chars"
             )
             continue
-        else:
-            new_data.append((tag, det))
+
+        new_data.append((tag, det))
 
     return new_data
 
@@ -212,8 +445,7 @@ def _skip_EXX_tags(text: str) -> bool:
     Returns:
         bool: True if the text is an EXX tag, False otherwise.
     """
-    pattern = r"^[()\[\]/\\]*E\d{2}[()\[\]/\\]*$"
-    return bool(re.fullmatch(pattern, text))
+    return bool(_EXX_TAG_RE.fullmatch(text))
 
 
 def _remove_specified_chars(word: str) -> str:
@@ -225,47 +457,80 @@ def _remove_specified_chars(word: str) -> str:
     Returns:
         The string with specified characters removed.
     """
-    chars_to_remove = "(){}[]\\/"
-    translation_table = str.maketrans("", "", chars_to_remove)
-    return word.translate(translation_table)
+    return word.translate(_REMOVE_CHARS_TABLE)
+
 
+"""@lru_cache(maxsize=1)
+def _get_spell_checker() -> SpellChecker:
+
+    Build the spell checker once per process and reuse it.
+
+    Loading bumi_words.json parses the file and rebuilds the word
+    frequency table, so it is not repeated for every document.
+
+    Returns:
+        SpellChecker: The spell checker with bumi_words.json loaded.
+
+    spell = SpellChecker()
+    spell.word_frequency.load_dictionary(
+        "ocr/main/inference/postprocessing/bumi_words.json"
+    )
+    return spell"""
+
+"""def _is_correctable_word(word: str) -> bool:
+
+    Check whether a cleaned word is eligible for spell correction.
+
+    Only words containing letters and of a minimum length are corrected,
+    and EXX tags are left alone.
+
+    Args:
+        word (str): The word with special characters already removed.
+
+    Returns:
+        bool: True if the word should be spell checked.
+
+    min_word_len_for_correction = 3  # Avoid correcting very short words
+    return (
+        any(c.isalpha() for c in word)
+        and len(word) >= min_word_len_for_correction
+        and not _skip_EXX_tags(word)
+    )"""
 
 """def _correct_text_if_needed(
     text_to_check: str,
-    spell_checker: SpellChecker,
+    corrections: dict[str, str],
 ) -> tuple[str, bool]:
 
-    Spell checks and corrects a single text string based on conditions.
+    Corrects a single text string using precomputed word corrections.
 
     Args:
         text_to_check (str): The text string to spell check.
-        spell_checker (SpellChecker): An instance of the SpellChecker.
+        corrections (dict[str, str]): Corrections for the unknown words of
+            the batch, as built by spell_check_tags.
 
     Returns:
         tuple[str, bool]: The corrected text and a boolean indicating
                           if any correction was made.
 
+    # Nothing to correct in text without letters
+    if _is_numeric_only(text_to_check):
+        return text_to_check, False
+
     words = text_to_check.split()
     corrected_word_list = []
     text_was_changed = False
-    min_word_len_for_correction = 3  # Avoid correcting very short words
 
     for current_word in words:
-        # Only attempt to correct words containing letters and of min length
-        current_word = _remove_specified_chars(current_word)
-        if (
-            not any(c.isalpha() for c in current_word)
-            or len(current_word) < min_word_len_for_correction
-            or _skip_EXX_tags(current_word)
-        ):
+        # Plain ASCII words have no brackets or slashes to strip
+        if not (current_word.isascii() and current_word.isalpha()):
+            current_word = _remove_specified_chars(current_word)
+        if not _is_correctable_word(current_word):
             corrected_word_list.append(current_word)
             continue
 
-        # spell.correction() returns original word if correct or unknown
-        best_candidate = spell_checker.correction(current_word)
-
-        if best_candidate is None:  # Should be rare for non-empty words
-            best_candidate = current_word  # Fallback to original
+        # Known words have no entry and are kept as they are
+        best_candidate = corrections.get(current_word) or current_word
 
         if best_candidate != current_word:
             corrected_word_list.append(best_candidate)
@@ -289,6 +554,11 @@ def spell_check_tags(tag_det_data: list[tuple]) -> list[tuple]:
     - Tags must contain alphabetic characters.
     - Tags must not have a hyphen in them.
 
+    Expects the output of filter_tags, which has already dropped tags
+    without alphabetic characters, so only the hyphen rule is checked here.
+    Tags are corrected in place and the input list is returned, rather than
+    copied into a new one.
+
     Args:
         tag_det_data (list[tuple]): List of tuples containing Tag objects and
                                     their associated detections.
@@ -297,42 +567,47 @@ def spell_check_tags(tag_det_data: list[tuple]) -> list[tuple]:
         list[tuple]: List of corrected tuples.
 
     logger.info("Spell checking tags.")
-    spell = SpellChecker()
-    spell.word_frequency.load_dictionary(
-        "ocr/main/inference/postprocessing/bumi_words.json"
-    )
+    spell = _get_spell_checker()
 
-    new_data = []
+    tags_to_check = [tag for tag, _ in tag_det_data if "-" not in tag.text]
+    if not tags_to_check:
+        logger.info("No tags to spell check or all tags were skipped.")
+        return tag_det_data
 
-    for tag, det in tag_det_data:
+    # Gather every distinct correctable word first so the dictionary is
+    # checked once per batch and correction() only runs on unknown words,
+    # once each, instead of on every word of every tag.
+    candidate_words = {
+        word
+        for tag in tags_to_check
+        for word in map(_remove_specified_chars, tag.text.split())
+        if _is_correctable_word(word)
+    }
+    unknown_words = spell.unknown(candidate_words)  # lowercased
+    corrections = {
+        word: spell.correction(word)
+        for word in candidate_words
+        if word.lower() in unknown_words
+    }
+
+    for tag in tags_to_check:
         original_text = tag.text
+        corrected_text, text_was_changed = _correct_text_if_needed(
+            original_text, corrections
+        )
 
-        if "-" in original_text or not any(c.isalpha() for c in original_text):
-            new_data.append((tag, det))
-            continue
+        if text_was_changed:
+            # Only update tag if the text was actually changed
+            tag.text = corrected_text
+            logger.info(
+                f"Corrected tag text from '{original_text}' to "
+                f"'{corrected_text}' on page {tag.page_number}."
+            )
         else:
-            corrected_text, text_was_changed = _correct_text_if_needed(
-                original_text, spell
+            logger.debug(
+                f"No correction needed for tag text: '{original_text}' "
+                f"on page {tag.page_number}."
             )
 
-            if text_was_changed:
-                # Only update tag if the text was actually changed
-                tag.text = corrected_text
-                logger.info(
-                    f"Corrected tag text from '{original_text}' to "
-                    f"'{corrected_text}' on page {tag.page_number}."
-                )
-            else:
-                logger.debug(
-                    f"No correction needed for tag text: '{original_text}' "
-                    f"on page {tag.page_number}."
-                )
-
-            new_data.append((tag, det))
-
-    if not new_data:
-        logger.info("No tags to spell check or all tags were skipped.")
-        return tag_det_data
-
-    return new_data
+    return tag_det_data
 """
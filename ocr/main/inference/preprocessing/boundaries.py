@@ -14,28 +14,25 @@ Useable functions:
     Returns:
         - figure_crop (np.ndarray): Cropped figure image.
         - table_crop (np.ndarray): Cropped table image.
-"""
+- `figure_table_regions`: Function to locate figure and table without cropping.
+    Args:
+        - img (np.ndarray): The page image.
+        - kwargs: Same as `figure_table_extraction`.
 
-import math  # For checking non-finite numbers
+    Returns:
+        - regions (list): (x1, y1, x2, y2) rects clipped to the image.
+"""
 
 import cv2 as cv
 import numpy as np
 from loguru import logger
 
-# --- Helper Functions ---
-
+# Page images are binarized at full resolution, then shrunk by this factor
+# before contour tracing, unless their shorter side is below the minimum
+CONTOUR_DOWNSCALE = 4
+CONTOUR_DOWNSCALE_MIN_SIDE = 1024
 
-def _get_image_dimensions(img: np.ndarray) -> tuple[int, int]:
-    """Gets the height and width of the image."""
-    if img.ndim == 2:  # Grayscale
-        h_img, w_img = img.shape
-    elif img.ndim == 3:  # Color
-        h_img, w_img, _ = img.shape
-    else:
-        raise ValueError(
-            f"Unsupported image dimensions: {img.ndim}. Expected 2 or 3."
-        )
-    return h_img, w_img
+# --- Helper Functions ---
 
 
 def _calculate_min_area_threshold(
@@ -57,121 +54,177 @@ def _calculate_edge_thresholds(
     return x_thresh_min, x_thresh_max, y_thresh_min, y_thresh_max
 
 
+def _contour_areas(contours) -> np.ndarray:
+    """Computes the area of every contour once, as an array."""
+    return np.fromiter(
+        (cv.contourArea(contour) for contour in contours),
+        dtype=np.float64,
+        count=len(contours),
+    )
+
+
 def _filter_contours_by_area_and_edge(
     contours: list,
+    areas: np.ndarray,
     min_area_threshold: float,
     x_thresh_min: float,
     x_thresh_max: float,
     y_thresh_min: float,
     y_thresh_max: float,
-) -> list:
+) -> tuple[list, np.ndarray]:
     """
     Filters contours based on minimum area and proximity to image edges.
 
     Returns:
-        list: A list of dictionaries, each {'contour': contour, 'area': area}.
+        tuple[list, np.ndarray]: The kept contours, in their original order,
+            and an array of their areas.
     """
-    filtered_contours_data = []
-    for contour in contours:
-        area = cv.contourArea(contour)
-        if area < min_area_threshold:
-            continue
-
-        x, y, w, h = cv.boundingRect(contour)
-        x_max_bbox = x + w
-        y_max_bbox = y + h
-
-        is_edge_artifact = (
-            x < x_thresh_min
-            or y < y_thresh_min
-            or x_max_bbox > x_thresh_max
-            or y_max_bbox > y_thresh_max
-        )
+    # Most contours are small, like the holes in letters, and fail on area
+    # alone; only the rest have their bounding boxes computed
+    large = np.flatnonzero(areas >= min_area_threshold)
+    if len(large) == 0:
+        return [], np.empty(0, dtype=np.float64)
+
+    # Bounding boxes of the large contours from one pass over their points.
+    # Like cv.boundingRect, the box ends one pixel past the largest point.
+    large_contours = [contours[i] for i in large]
+    lengths = [len(contour) for contour in large_contours]
+    starts = np.cumsum([0] + lengths[:-1])
+    points = np.concatenate(large_contours).reshape(-1, 2)
+    bbox_mins = np.minimum.reduceat(points, starts)
+    bbox_maxs = np.maximum.reduceat(points, starts) + 1
+
+    is_edge_artifact = (
+        (bbox_mins[:, 0] < x_thresh_min)
+        | (bbox_mins[:, 1] < y_thresh_min)
+        | (bbox_maxs[:, 0] > x_thresh_max)
+        | (bbox_maxs[:, 1] > y_thresh_max)
+    )
 
-        if not is_edge_artifact:
-            filtered_contours_data.append({"contour": contour, "area": area})
-    return filtered_contours_data
+    kept = large[~is_edge_artifact]
+    return [contours[i] for i in kept], areas[kept]
 
 
 def _identify_primary_candidates(
-    valid_contours_data: list,  # List of {'contour': contour, 'area': area}
+    areas: np.ndarray,
     area_drop_off_ratio: float,
-) -> list:
+) -> np.ndarray:
     """
     Identifies a group of primary contours by looking for a significant
     drop-off in area among the largest remaining contours.
 
     Args:
-        valid_contours_data (list): Contours sorted by area, descending.
+        areas (np.ndarray): Areas of the valid contours, in any order.
         area_drop_off_ratio (float): Area ratio threshold.
 
     Returns:
-        list: List of primary candidate contours (dictionaries with 'contour'
-              and 'area').
+        np.ndarray: Indices into ``areas`` of the primary candidates,
+            largest first.
     """
-    if not valid_contours_data:
-        return []
-
-    primary_candidates = []
-    # Sort by area descending, if not already (defensive)
-    valid_contours_data.sort(key=lambda item: item["area"], reverse=True)
-
-    if len(valid_contours_data) == 1:
-        return valid_contours_data  # Only one candidate
-
-    primary_candidates.append(
-        valid_contours_data[0]
-    )  # Add the largest unconditionally
-
-    for i in range(len(valid_contours_data) - 1):
-        current_area = valid_contours_data[i]["area"]
-        next_area = valid_contours_data[i + 1]["area"]
-
-        if next_area <= 1e-6:  # Avoid division by zero or very small numbers
-            break
-
-        ratio = current_area / next_area
-        if not math.isfinite(ratio) or ratio >= area_drop_off_ratio:
-            break  # Significant drop or invalid ratio
-        else:
-            primary_candidates.append(valid_contours_data[i + 1])
-
-    return primary_candidates
+    if len(areas) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Sort by area descending; the stable sort keeps ties in contour order
+    order = np.argsort(-areas, kind="stable")
+    sorted_areas = areas[order]
+    current_areas, next_areas = sorted_areas[:-1], sorted_areas[1:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = current_areas / next_areas
+
+    # The group ends at the first significant drop, invalid ratio, or
+    # (near) zero area, which would make the ratio meaningless
+    stops = (
+        (next_areas <= 1e-6)
+        | ~np.isfinite(ratios)
+        | (ratios >= area_drop_off_ratio)
+    )
+    num_candidates = int(np.argmax(stops)) + 1 if stops.any() else len(areas)
+    return order[:num_candidates]
 
 
 def _select_smallest_contour(
-    primary_candidates: list,
+    contours: list,
+    areas: np.ndarray,
+    primary_candidates: np.ndarray,
 ) -> list:  # Returns list with 0 or 1 contour
     """
     Selects the contour with the smallest area from the primary candidates.
 
     Args:
-        primary_candidates (list): List of {'contour': contour, 'area': area}.
+        contours (list): The valid contours.
+        areas (np.ndarray): Areas of ``contours``.
+        primary_candidates (np.ndarray): Indices of the primary candidates.
 
     Returns:
         list: A list containing the smallest contour, or an empty list.
     """
-    if not primary_candidates:
+    if len(primary_candidates) == 0:
         return []
 
-    # Sort by area ascending to find the smallest
-    primary_candidates.sort(key=lambda item: item["area"])
-    return [primary_candidates[0]["contour"]]
+    # argmin keeps the first of equally small candidates
+    smallest = primary_candidates[np.argmin(areas[primary_candidates])]
+    return [contours[smallest]]
 
 
 def _find_contours(
     img,
     min_thresh=127,
     max_thresh=255,
-    mode=cv.RETR_TREE,
+    mode=cv.RETR_LIST,
     method=cv.CHAIN_APPROX_SIMPLE,
+    downscale=CONTOUR_DOWNSCALE,
+    use_otsu=False,
+    denoise=False,
 ):
     """
     Takes a MatLike object and returns contours. This function handles the
     binarization of the image as well as the contour finding.
+
+    Contours are retrieved as a flat list since the hierarchy is never
+    used. RETR_EXTERNAL is not an option: the figure boundary is a region
+    nested inside the page's border lines, not an outermost contour.
+
+    Contour tracing scales with the number of pixels and the boundaries
+    only need to be found at document scale, so large images are traced
+    at 1/downscale of their size and the contours scaled back to image
+    coordinates. A downscaled pixel stays set only if every pixel it
+    covers was set, so thin dark border lines still separate regions.
+
+    With use_otsu=True the threshold is chosen per image with Otsu's
+    method, which splits low contrast scans cleanly where the fixed
+    min_thresh leaves noise contours behind. Rendered PDF pages are
+    already bimodal, so by default they are binarized at min_thresh.
+    With denoise=True, a 3x3 opening removes isolated light specks from the
+    mask before tracing, so they never become contours.
     """
-    _, thresh = cv.threshold(img, min_thresh, max_thresh, cv.THRESH_BINARY)
+    if use_otsu:
+        _, thresh = cv.threshold(
+            img, 0, max_thresh, cv.THRESH_BINARY | cv.THRESH_OTSU
+        )
+    else:
+        _, thresh = cv.threshold(img, min_thresh, max_thresh, cv.THRESH_BINARY)
+
+    h_img, w_img = thresh.shape[:2]
+    scaled = downscale > 1 and min(h_img, w_img) >= CONTOUR_DOWNSCALE_MIN_SIDE
+    if scaled:
+        thresh = cv.resize(
+            thresh,
+            (w_img // downscale, h_img // downscale),
+            interpolation=cv.INTER_AREA,
+        )
+        _, thresh = cv.threshold(
+            thresh, max_thresh - 1, max_thresh, cv.THRESH_BINARY
+        )
+
+    if denoise:
+        kernel = np.ones((3, 3), np.uint8)
+        thresh = cv.morphologyEx(thresh, cv.MORPH_OPEN, kernel)
+
     all_contours, _ = cv.findContours(thresh, mode, method)
+    if scaled:
+        for contour in all_contours:
+            contour *= downscale
 
     return all_contours
 
@@ -199,29 +252,30 @@ def _figure_extraction(img: np.ndarray, **kwargs):
             - min_area_ratio (float): Minimum area ratio for contour filter.
             - edge_margin_ratio (float): Edge margin ratio for contour filter.
             - area_drop_off_ratio (float): Drop-off ratio for contour filter.
+            - use_otsu (bool): Binarize with Otsu's threshold, for scans.
+            - denoise (bool): Remove specks from the mask before tracing.
             - show_bbox (bool): Bool to display the bounding box on the image.
 
     Returns:
         tuple | None: The bbox of the figure in the format (x, y, w, h).
     """
-    contours = _find_contours(img)
+    contours = _find_contours(
+        img,
+        use_otsu=kwargs.get("use_otsu", False),
+        denoise=kwargs.get("denoise", False),
+    )
 
     if not contours:
         logger.warning(
             "No contours found in the image. Using fallback of entire image."
         )
-        contours = (
-            np.array(
-                [
-                    [0, 0],
-                    [img.shape[1], 0],
-                    [img.shape[1], img.shape[0]],
-                    [0, img.shape[0]],
-                ]
-            )
-            .reshape(-1, 1, 2)
-            .astype(np.int32)
-        )
+        figure_bbox = (0, 0, img.shape[1], img.shape[0])
+        if kwargs.get("show_bbox", False):
+            _draw_bbox_on_image(img, figure_bbox)
+        return figure_bbox
+
+    # Areas are computed once and shared with the fallback below
+    areas = _contour_areas(contours)
 
     contour_candidates = find_significant_inner_boundary(
         all_contours=contours,
@@ -233,12 +287,12 @@ def _figure_extraction(img: np.ndarray, **kwargs):
         area_drop_off_ratio=kwargs.get(
             "area_drop_off_ratio", 1.75
         ),  # Drop-off if area ratio > 1.75
+        areas=areas,
     )
 
     if not contour_candidates:
         logger.warning("No significant inner boundary found. Using fallback.")
-        sorted_contours = sorted(contours, key=cv.contourArea, reverse=True)
-        best_candidate = sorted_contours[0]
+        best_candidate = contours[int(np.argmax(areas))]
     else:
         best_candidate = contour_candidates[0]
 
@@ -268,11 +322,11 @@ def _table_extraction(img, figure_bbox, **kwargs):
     # and trim the top and bottom of the image to the figure bbox
     fx, fy, fw, fh = figure_bbox
 
-    logger.debug(f"Figure BBox: {figure_bbox}, Image Shape: {img.shape}")
+    logger.debug("Figure BBox: {}, Image Shape: {}", figure_bbox, img.shape)
     ih, iw = img.shape
 
     table_bbox = fx + fw, fy, iw - (fx + fw), fh
-    logger.debug(f"Table BBox: {table_bbox}")
+    logger.debug("Table BBox: {}", table_bbox)
 
     if kwargs.get("show_bbox", False):
         _draw_bbox_on_image(img, table_bbox)
@@ -305,52 +359,23 @@ def _extract_crop_and_offset(
             - offset (tuple[int, int]): The (x, y) coordinates of the top-left
             corner of the bounding box.
     """
-    x, y, w, h = bbox
-    offset = (x, y)  # The offset is always the top-left of the bbox
-
-    crop = None
-    if (
-        w > 0
-        and h > 0
-        and x < img_width
-        and y < img_height
-        and (x + w) > 0
-        and (y + h) > 0
-    ):
-        # Calculate slice coordinates, clipped to image boundaries
-        slice_x_start = max(0, x)
-        slice_y_start = max(0, y)
-        slice_x_end = min(img_width, x + w)
-        slice_y_end = min(img_height, y + h)
-
-        # Ensure the slice has positive dimensions after clipping
-        if slice_x_end > slice_x_start and slice_y_end > slice_y_start:
-            crop = original_image[
-                slice_y_start:slice_y_end, slice_x_start:slice_x_end
-            ]
-            if (
-                crop.size == 0
-            ):  # Should be redundant if previous check is robust
-                logger.warning(
-                    f"{item_name.capitalize()} crop for bbox {bbox}=empty im."
-                )
-                crop = None
-        else:
-            logger.warning(
-                f"{item_name} bbox {bbox} resulted in non-positive slice "
-                f"dimensions after clipping: (x_start={slice_x_start}, "
-                f"y_start={slice_y_start}, width={slice_x_end-slice_x_start}, "
-                f"height={slice_y_end-slice_y_start}). No crop generated."
-            )
-            # crop remains None
-    else:
+    offset = (bbox[0], bbox[1])  # The offset is always the top-left
+
+    # Clip the bbox to the image; nothing left means there is nothing to crop
+    region = _bbox_to_region(bbox, img_width, img_height)
+    if region is None:
+        # Formatted by loguru only if a sink accepts DEBUG records
         logger.debug(
-            f"{item_name.capitalize()} bbox {bbox} has zero/negative "
-            / "dimensions or is entirely outside image. No crop generated."
+            "{} bbox {} has zero/negative dimensions or is entirely outside "
+            "image. No crop generated.",
+            item_name.capitalize(),
+            bbox,
         )
-        # crop remains None
+        return None, offset
 
-    return crop, offset
+    # Slicing returns a view of the original image, not a copy
+    x1, y1, x2, y2 = region
+    return original_image[y1:y2, x1:x2], offset
 
 
 def _ensure_3_channel_image(img_crop: np.ndarray | None) -> np.ndarray | None:
@@ -373,6 +398,7 @@ def find_significant_inner_boundary(
     min_area_ratio: float = 0.01,
     edge_margin_ratio: float = 0.001,
     area_drop_off_ratio: float = 1.75,
+    areas: np.ndarray | None = None,
 ) -> list:  # Returns a list containing one contour, or an empty list
     """
     Finds the most likely inner significant boundary contour in an image.
@@ -384,6 +410,8 @@ def find_significant_inner_boundary(
         min_area_ratio (float): Min contour area as fraction of image area.
         edge_margin_ratio (float): Border margin to identify edge artifacts.
         area_drop_off_ratio (float): Area ratio for detecting area drop-off.
+        areas (np.ndarray | None): Precomputed areas of ``all_contours``.
+            Computed here if not given.
 
     Returns:
         list: A list containing the identified boundary contour, or empty list.
@@ -393,64 +421,71 @@ def find_significant_inner_boundary(
         logger.warning("Warning: No contours provided.")
         return []
 
-    try:
-        h_img, w_img = _get_image_dimensions(img)
-    except ValueError as e:
-        logger.error(f"Error getting image dimensions: {e}")
-        return []
+    # (height, width) for both grayscale and color images
+    h_img, w_img = img.shape[:2]
 
-    logger.debug(f"Image Dimensions (HxW): {h_img} x {w_img}")
+    # Debug messages pass their fields as arguments so loguru only formats
+    # them when DEBUG records are emitted
+    logger.debug("Image Dimensions (HxW): {} x {}", h_img, w_img)
 
     min_area_thresh = _calculate_min_area_threshold(
         h_img, w_img, min_area_ratio
     )  # noqa: E501
     logger.debug(
-        f"Min Area Threshold ({min_area_ratio*100:.2f}% of total): {min_area_thresh:.2f}"  # noqa: E501
+        "Min Area Threshold ({:.2f}% of total): {:.2f}",
+        min_area_ratio * 100,
+        min_area_thresh,
     )
 
     x_min, x_max, y_min, y_max = _calculate_edge_thresholds(
         h_img, w_img, edge_margin_ratio
     )
     logger.debug(
-        f"Edge Thresholds: x=[{x_min:.2f}, {x_max:.2f}], y=[{y_min:.2f}, {y_max:.2f}]"  # noqa: E501
+        "Edge Thresholds: x=[{:.2f}, {:.2f}], y=[{:.2f}, {:.2f}]",
+        x_min,
+        x_max,
+        y_min,
+        y_max,
     )
 
     # Initial filtering
-    valid_contours_data = _filter_contours_by_area_and_edge(
-        all_contours, min_area_thresh, x_min, x_max, y_min, y_max
+    if areas is None:
+        areas = _contour_areas(all_contours)
+
+    valid_contours, valid_areas = _filter_contours_by_area_and_edge(
+        all_contours, areas, min_area_thresh, x_min, x_max, y_min, y_max
     )
     logger.debug(
-        f"Found {len(valid_contours_data)} contours after area and edge filtering."  # noqa: E501
+        "Found {} contours after area and edge filtering.",
+        len(valid_contours),
     )
 
-    if not valid_contours_data:
+    if not valid_contours:
         logger.warning(
             "Warning: No valid contours remaining after initial filtering."
         )
         return []
 
     # Identify primary candidates based on area drop-off
-    # Note: _identify_primary_candidates expects data sorted descending by area
-    valid_contours_data.sort(
-        key=lambda item: item["area"], reverse=True
-    )  # Ensure sort order
-    primary_candidates_data = _identify_primary_candidates(
-        valid_contours_data, area_drop_off_ratio
-    )
-    logger.debug(
-        f"Identified {len(primary_candidates_data)} primary candidates."
+    primary_candidates = _identify_primary_candidates(
+        valid_areas, area_drop_off_ratio
     )
+    logger.debug("Identified {} primary candidates.", len(primary_candidates))
 
-    if not primary_candidates_data:
+    if len(primary_candidates) == 0:
         logger.warning("Warning: No primary candidates identified.")
         return []
 
     # Select the smallest area contour from the primary candidates
-    figure_contour_list = _select_smallest_contour(primary_candidates_data)
+    figure_contour_list = _select_smallest_contour(
+        valid_contours, valid_areas, primary_candidates
+    )
 
     if figure_contour_list:
-        logger.debug(
-            f"Selected inner boundary contour with area: {cv.contourArea(figure_contour_list[0]):.2f}"  # noqa: E501
+        # The area is only measured if the record is emitted
+        logger.opt(lazy=True).debug(
+            "Selected inner boundary contour with area: {:.2f}",
+            lambda: cv.contourArea(figure_contour_list[0]),
         )
     else:
         logger.warning(
@@ -481,11 +516,10 @@ def figure_table_extraction(img: np.ndarray, **kwargs) -> tuple | None:
         logger.error("Input image is None or empty.")
         return None, None, None, None
 
-    try:
-        h_img, w_img = _get_image_dimensions(img)
-    except ValueError as e:
-        logger.error(f"Main extraction: invalid image dimensions: {e}")
+    if img.ndim not in (2, 3):
+        logger.error(f"Main extraction: invalid image dimensions: {img.ndim}")
         return None, None, None, None
+    h_img, w_img = img.shape[:2]
 
     fig_crop, fig_offset = None, None
     tbl_crop, tbl_offset = None, None
@@ -532,3 +566,68 @@ def figure_table_extraction(img: np.ndarray, **kwargs) -> tuple | None:
         logger.warning("Figure bbox not available; table extraction skipped.")
 
     return fig_crop, tbl_crop, fig_offset, tbl_offset
+
+
+def _bbox_to_region(
+    bbox: tuple[int, int, int, int], img_width: int, img_height: int
+) -> tuple[int, int, int, int] | None:
+    """
+    Converts an (x, y, w, h) bbox to an (x1, y1, x2, y2) rect clipped to the
+    image. Returns None if nothing of the bbox lies inside the image.
+    """
+    x, y, w, h = bbox
+    x1, y1 = max(0, x), max(0, y)
+    x2, y2 = min(img_width, x + w), min(img_height, y + h)
+    if x2 <= x1 or y2 <= y1:
+        return None
+    return int(x1), int(y1), int(x2), int(y2)
+
+
+def figure_table_regions(img: np.ndarray, **kwargs) -> list:
+    """
+    Locates the figure and table of an image without cropping it, so the
+    full image can be sent to OCR once along with the regions to read.
+
+    Args:
+        img (np.ndarray): The image to process.
+        **kwargs: Additional arguments for figure and table extraction.
+            - figure_kwargs (dict): Arguments for figure extraction.
+            - table_kwargs (dict): Arguments for table extraction.
+
+    Returns:
+        list[tuple[int, int, int, int]]: The (x1, y1, x2, y2) figure and
+            table rects that are non-empty, in that order.
+    """
+    if img is None or img.size == 0:
+        logger.error("Input image is None or empty.")
+        return []
+
+    if img.ndim not in (2, 3):
+        logger.error(
+            f"Region extraction: invalid image dimensions: {img.ndim}"
+        )
+        return []
+    h_img, w_img = img.shape[:2]
+
+    try:
+        fig_bbox = _figure_extraction(img, **kwargs.get("figure_kwargs", {}))
+    except Exception as e:
+        logger.exception(f"Error during figure processing: {e}")
+        return []
+
+    if not fig_bbox:
+        logger.warning("Figure extraction failed to return bbox.")
+        return []
+
+    regions = [_bbox_to_region(fig_bbox, w_img, h_img)]
+
+    try:
+        table_bbox = _table_extraction(
+            img, fig_bbox, **kwargs.get("table_kwargs", {})
+        )
+        regions.append(_bbox_to_region(table_bbox, w_img, h_img))
+    except Exception as e:
+        logger.exception(f"Error during table processing: {e}")
+        # Preserve figure results
+
+    return [region for region in regions if region is not None]
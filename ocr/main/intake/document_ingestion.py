@@ -1,20 +1,36 @@
 import datetime as dt
+import hashlib
 
 from django.core.files import File
-from django.db.models import Q
+from django.db.models import Case, Q, When
 from loguru import logger
 
 from ocr.models import Document
 
 
+def _content_hash(file: File) -> str:
+    """
+    Hash the contents of a file with BLAKE2b, reading it chunk by chunk.
+
+    Args:
+        file (File): The file to hash.
+
+    Returns:
+        str: The 32 character hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in file.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
 def save_document(file: File, vessel_id: int) -> int | None:
     """
     Saves or updates a Document record in the database using an uploaded file
     and an associated Vessel. Checks for an existing document with the same
-    vessel, file name, or derived document number. Compares metadata (file
-    size and last modified timestamp). If an existing document is found and
-    its metadata differs, the document is deleted and a new one is created.
-    Otherwise, the document is not re-saved.
+    vessel and content hash, and if one exists the document is not re-saved.
+    Otherwise a document with the same file name, or failing that the same
+    derived document number, is deleted and replaced by the new one.
 
     Args:
         file (File): The uploaded file object.
@@ -24,7 +40,7 @@ def save_document(file: File, vessel_id: int) -> int | None:
         A list of integers representing the IDs of the saved or updated
         Document records.
 
-        None if the document already exists with identical metadata.
+        None if the document already exists with identical contents.
 
     Raises:
         IntegrityError: If database constraints are violated during saving.
@@ -39,8 +55,9 @@ def save_document(file: File, vessel_id: int) -> int | None:
     """
     file_name = file.name.strip()
     file_size = file.size
+    content_hash = _content_hash(file)
     last_modified = dt.datetime.now()  # Using current time as last_modified
-    document_number = file_name.split(".")[0].strip()
+    document_number = file_name.partition(".")[0].strip()
 
     # if there is still white space within document_number, then it is abnormal
     # and we should get the 0th element of a split on whitespace
@@ -53,39 +70,46 @@ def save_document(file: File, vessel_id: int) -> int | None:
         logger.debug(
             f"Document number after whitespace split: {document_number}"
         )
-    try:
-        department_origin = document_number.split("-")[1].strip().upper()
-    except IndexError as e:
+    # The department origin is the second hyphen-separated field. Without
+    # a hyphen it is left blank rather than failing the upload.
+    _, hyphen, after_hyphen = document_number.partition("-")
+    department_origin = after_hyphen.partition("-")[0].strip().upper()
+    if not hyphen:
         logger.warning("department_origin operation failed")
-        logger.warning(f"Error: {e}")
         logger.warning(f"File name: {file_name}")
         logger.warning(f"Document number: {document_number}")
-        logger.warning(
-            f"department_origin split: {document_number.split('-')}"
-        )
 
     if "_" in document_number:
         document_number = document_number.split("_")[0]
 
-    # Check if a document with the same vessel and file name or document number exists. # noqa 501
-    existing_doc_qs = Document.objects.filter(vessel_id=vessel_id).filter(
-        Q(name=file_name) | Q(document_number=document_number)
+    # last_modified is always the upload time, so only the content hash
+    # can tell a re-upload of the same file from a changed one. Identical
+    # contents anywhere on the vessel mean there is nothing to save.
+    duplicate = (
+        Document.objects.filter(vessel_id=vessel_id, content_hash=content_hash)
+        .only("id", "name")
+        .first()
     )
+    if duplicate is not None:
+        logger.info(
+            f"Upload '{file_name}' has identical contents to existing document '{duplicate.name}' (id {duplicate.id}); skipping save."  # noqa 501
+        )
+        return
 
-    if existing_doc_qs.exists():
-        existing_doc = existing_doc_qs.first()
-        size_change = existing_doc.file_size != file_size
-        modified_change = existing_doc.last_modified != last_modified
-        if size_change or modified_change:
-            existing_doc.delete()
-            logger.info(
-                f"Document '{file_name}' has changed (size or modification time); deleting existing record."  # noqa 501
-            )
-        else:
-            logger.info(
-                f"Document '{file_name}' already exists with identical metadata; skipping save."  # noqa 501
-            )
-            return
+    # A document with the same file name, or else the same document number,
+    # is an older version of this one and gets replaced.
+    existing_doc = (
+        Document.objects.filter(vessel_id=vessel_id)
+        .filter(Q(name=file_name) | Q(document_number=document_number))
+        .order_by(Case(When(name=file_name, then=0), default=1), "id")
+        .only("id")
+        .first()
+    )
+    if existing_doc is not None:
+        existing_doc.delete()
+        logger.info(
+            f"Document '{file_name}' has changed (content hash); deleting existing record."  # noqa 501
+        )
 
     # Django's FileField will handle saving the file permanently.
     new_document = Document(
@@ -95,6 +119,7 @@ def save_document(file: File, vessel_id: int) -> int | None:
         department_origin=department_origin,
         file=file,
         file_size=file_size,
+        content_hash=content_hash,
         last_modified=last_modified,
     )
     new_document.save()
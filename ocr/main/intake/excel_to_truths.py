@@ -30,55 +30,76 @@ def et_kraken(spreadsheet_path: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame containing the extracted columns, cleaned.
     """
-    df = pd.read_excel(spreadsheet_path)
-
     # Note the space in the column name "Tag Number "
-    target_columns = ["Document Number", "Tag Number "]
-    new_columns = ["document_number", "tag_number"]
-
-    new_df = df[target_columns].copy(deep=True)
-    new_df.columns = new_columns
+    columns = {
+        "Document Number": "document_number",
+        "Tag Number ": "tag_number",
+    }
+
+    # Only parse the two columns that are used. Both are read as text, as
+    # stored in the Truth CharFields and matched by the UNTAGGED filter.
+    df = pd.read_excel(
+        spreadsheet_path,
+        usecols=list(columns),
+        engine="openpyxl",
+        dtype=str,
+    )
+    df = df.rename(columns=columns)
 
     # Remove rows with missing values
-    new_df = new_df.dropna()
+    df = df.dropna(subset=list(columns.values()))
 
     # Remove rows with UNTAGGED in the tag_number string
-    new_df = new_df[
-        new_df["tag_number"].str.contains("UNTAGGED") == False
-    ]  # noqa E712
+    untagged = df["tag_number"].str.contains("UNTAGGED", regex=False, na=False)
 
-    return new_df
+    return df.loc[~untagged]
 
 
 def load_kraken(kraken_df: pd.DataFrame) -> None:
     """
     Take a DataFrame and load it into the database.
 
+    Documents are looked up once for every document number in the frame
+    and all truths are inserted in batches, rather than one query and one
+    insert per row.
+
     Args:
         kraken_df (pd.DataFrame): DataFrame containing the data to load.
     """
-
-    for _, row in kraken_df.iterrows():
-        # Create a new Truth object
-        truth = Truth(
-            document=Document.objects.filter(
-                document_number=row["document_number"]
-            ).first(),
-            document_number=row["document_number"],
-            text=row["tag_number"],
-            created_at=dt.datetime.now(),
+    document_numbers = kraken_df["document_number"].unique().tolist()
+
+    # Only (number, ID) pairs are needed, so no Document instances are
+    # built. document_number is not unique; with the highest IDs first,
+    # dict() keeps the lowest ID for each number, as filter().first() did.
+    document_ids = dict(
+        Document.objects.filter(document_number__in=document_numbers)
+        .order_by("-id")
+        .values_list("document_number", "id")
+    )
+
+    created_at = dt.datetime.now()
+    truths = [
+        Truth(
+            document_id=document_ids.get(row.document_number),
+            document_number=row.document_number,
+            text=row.tag_number,
+            created_at=created_at,
         )
-        # Save the object to the database
-        truth.save()
+        for row in kraken_df.itertuples(index=False)
+    ]
+    Truth.objects.bulk_create(truths, batch_size=1000)
 
     logger.info(f"Loaded {len(kraken_df)} truths into the database.")
 
     return
 
 
-Truth.objects.all().delete()
+if __name__ == "__main__":
+    Truth.objects.all().delete()
 
-spreadsheet_path = "C:\\Users\\User\\Downloads\\OVERALL BAE P&ID_250213.xlsx"
+    spreadsheet_path = (
+        "C:\\Users\\User\\Downloads\\OVERALL BAE P&ID_250213.xlsx"
+    )
 
-kraken_df = et_kraken(spreadsheet_path)
-load_kraken(kraken_df)
+    kraken_df = et_kraken(spreadsheet_path)
+    load_kraken(kraken_df)
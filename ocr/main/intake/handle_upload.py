@@ -1,31 +1,171 @@
 import os
 import shutil
+import threading
 import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from celery import current_app
 from django.core.files import File
 from loguru import logger
 
 from babaatsite.settings import MEDIA_ROOT
-from ocr.main.utils.task_helpers import _chunk_and_dispatch_tasks
-from ocr.tasks import process_pdf_task
+from ocr.tasks import process_pdf_task, unzip_and_dispatch_task
 
+# Zip entries are decompressed and written by this many threads at most
+EXTRACT_MAX_WORKERS = 12
 
-def unzip_file(zip_path: str) -> str:
+# Buffer size when streaming a zip entry or upload to disk
+COPY_BUFFER_SIZE = 1 << 20
+
+
+def _write_zip_entry(
+    zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target: str
+) -> None:
     """
-    Unzips the given zip file to the specified directory.
+    Write a single zip entry to target.
+
+    Entries that fit in one copy buffer are decompressed in a single read
+    and handed to one write call, skipping the chunked copy loop, so each
+    costs little more than an open, a write and a close. Larger entries
+    are streamed in COPY_BUFFER_SIZE chunks.
+
+    Args:
+        zip_ref (zipfile.ZipFile): The open zip file.
+        info (zipfile.ZipInfo): The entry to write.
+        target (str): The destination path.
+    """
+    if info.file_size <= COPY_BUFFER_SIZE:
+        data = zip_ref.read(info)
+        with open(target, "wb") as dst:
+            dst.write(data)
+        return
+
+    with zip_ref.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+def _make_dirs(dirs: set[str], root: str) -> None:
+    """
+    Create a set of directories under root in one pass.
+
+    The deepest directories are created first, and each creation marks its
+    ancestors up to root as existing, so every directory costs at most one
+    makedirs call and none are left to the extraction threads.
+
+    Args:
+        dirs (set[str]): Absolute directory paths under root.
+        root (str): The extraction root, which already exists.
+    """
+    created = {root}
+    for path in sorted(dirs, key=lambda d: d.count(os.sep), reverse=True):
+        if path in created:
+            continue
+        os.makedirs(path, exist_ok=True)
+        while path not in created:
+            created.add(path)
+            path = os.path.dirname(path)
+
+
+def _extract_zip_entries(
+    zip_path: str, dest_dir: str, pdfs_only: bool = False
+) -> Iterator[str]:
+    """
+    Extract the entries of a zip file into dest_dir using a thread pool.
+
+    Each thread reads through its own ZipFile handle, so entries are
+    decompressed and written concurrently instead of one at a time. Paths
+    are yielded as soon as each file is written, in completion order, so
+    the caller can act on early entries while later ones are extracted.
+    Entries whose path would land outside dest_dir are skipped.
 
     Args:
         zip_path (str): The path to the zip file.
-        extract_to (str): The directory where the files will be extracted.
+        dest_dir (str): The directory to extract into.
+        pdfs_only (bool): Only extract entries ending in .pdf.
 
-    Returns:
-        str: The path to the directory where the files were extracted.
+    Yields:
+        str: The path of each extracted file.
+    """
+    dest_root = os.path.realpath(dest_dir)
+
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        infos = zip_ref.infolist()
+
+    # Resolve every destination and collect the directories they need
+    targets = []
+    dirs = set()
+    for info in infos:
+        # Lower-case only the four-character suffix, not the whole path
+        if pdfs_only and (
+            info.is_dir() or info.filename[-4:].lower() != ".pdf"
+        ):
+            continue
+        target = os.path.realpath(os.path.join(dest_root, info.filename))
+        if os.path.commonpath([dest_root, target]) != dest_root:
+            logger.warning(f"Skipping unsafe zip entry: {info.filename}")
+            continue
+        if info.is_dir():
+            dirs.add(target)
+            continue
+        targets.append((info, target))
+        dirs.add(os.path.dirname(target))
+    _make_dirs(dirs, dest_root)
+
+    local = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+
+    def extract_one(entry):
+        info, target = entry
+        if not hasattr(local, "zip_ref"):
+            local.zip_ref = zipfile.ZipFile(zip_path, "r")
+            with handles_lock:
+                handles.append(local.zip_ref)
+        _write_zip_entry(local.zip_ref, info, target)
+
+    workers = min(EXTRACT_MAX_WORKERS, os.cpu_count() or 1)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(extract_one, entry): entry[1]
+                for entry in targets
+            }
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _check_zipfile(zip_path: str) -> None:
+    """
+    Raise a ValueError if the file at zip_path is not a zip file.
+
+    Args:
+        zip_path (str): The path to the zip file.
     """
     if not zipfile.is_zipfile(zip_path):
         error_msg = f"File at {zip_path} is not a valid zip file."
         logger.error(error_msg)
         raise ValueError(error_msg)
 
+
+def unzip_file(zip_path: str, pdfs_only: bool = False) -> Iterator[str]:
+    """
+    Unzips the given zip file into an extracted/ directory beside it and
+    deletes the zip once every entry has been extracted.
+
+    Args:
+        zip_path (str): The path to the zip file.
+        pdfs_only (bool): Only extract entries ending in .pdf.
+
+    Yields:
+        str: The path of each extracted file, as soon as it is written.
+    """
+    _check_zipfile(zip_path)
+
     # Construct the destination directory path
     base_dir = os.path.dirname(zip_path)
     file_base = os.path.splitext(os.path.basename(zip_path))[0]
@@ -33,10 +173,14 @@ def unzip_file(zip_path: str) -> str:
     os.makedirs(dest_dir, exist_ok=True)
 
     # Extract the zip file contents to the destination directory
+    extracted = 0
     try:
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(dest_dir)
-        logger.info(f"Extracted zip file to {dest_dir}")
+        for path in _extract_zip_entries(
+            zip_path, dest_dir, pdfs_only=pdfs_only
+        ):
+            extracted += 1
+            yield path
+        logger.info(f"Extracted {extracted} files to {dest_dir}")
     except Exception as e:
         logger.error(f"Error extracting zip file at {zip_path}: {e}")
         raise
@@ -48,19 +192,22 @@ def unzip_file(zip_path: str) -> str:
     except Exception as e:
         logger.error(f"Error deleting zip file at {zip_path}: {e}")
 
-    return dest_dir
-
-
-def get_detections(document_ids: list[int]) -> list[dict]:
-    return
-
 
 def _save_in_chunks(
-    django_file: File, dest_path: str, chunk_size: int = 64 * 1024
+    django_file: File, dest_path: str, chunk_size: int = COPY_BUFFER_SIZE
 ):
     """
     Write an uploaded file to disk in chunks to avoid large memory usage.
+
+    Uploads Django has already spooled to a temporary file are copied by
+    path with shutil.copyfile, which has the kernel copy the data
+    (sendfile on Linux) rather than reading it through Python.
     """
+    if hasattr(django_file, "temporary_file_path"):
+        shutil.copyfile(django_file.temporary_file_path(), dest_path)
+        django_file.close()
+        return dest_path
+
     django_file.seek(0)
     with open(dest_path, "wb") as out, django_file.file as src:
         shutil.copyfileobj(src, out, length=chunk_size)
@@ -68,62 +215,70 @@ def _save_in_chunks(
     return dest_path
 
 
-def _collect_pdfs(directory_path):
+def extract_and_dispatch_zip(zip_path: str, vessel_id: int):
     """
-    Return a flat list of all pdf file paths under directory_path (disk paths).
+    Extract the pdfs of an uploaded zip and queue each one for ingestion.
+
+    Runs inside unzip_and_dispatch_task so decompression happens on a
+    Celery worker rather than the request thread.
+
+    Args:
+        zip_path (str): The path to the uploaded zip file on disk.
+        vessel_id (int): The ID of the vessel associated with the pdfs.
+
+    Returns:
+        list[AsyncResult]: One result per queued process_pdf_task.
     """
-    pdfs = []
-    for root, _, files in os.walk(directory_path):
-        for fn in files:
-            if fn.lower().endswith(".pdf"):
-                pdfs.append(os.path.join(root, fn))
-    return pdfs
+    # Each pdf is published as soon as it is written, so ingestion starts
+    # while the rest of the zip is still being extracted. Every message
+    # goes out through one producer instead of acquiring one per task.
+    results = []
+    with current_app.producer_pool.acquire(block=True) as producer:
+        for pdf_path in unzip_file(zip_path, pdfs_only=True):
+            results.append(
+                process_pdf_task.apply_async(
+                    (pdf_path,), {"vessel_id": vessel_id}, producer=producer
+                )
+            )
+
+    if not results:
+        logger.warning(f"No PDF files found in upload {zip_path}")
+    return results
 
 
-def handle_uploaded_file(django_file: File, vessel_id: int) -> None:
+def handle_uploaded_file(django_file: File, vessel_id: int) -> list:
     """
     Handle the uploaded file. This function processes the uploaded file,
-    which may be a pdf or a zip file. From a pdf, it creates a document
-    and page objects. From a zip file, it extracts the pdfs and populates
-    the Document table with the pdfs and then populates the Page table
-    with images of the pdfs' pages. Finally we also create detections
-    for each new page we create.
-
+    which may be a pdf or a zip file. A pdf is queued for ingestion
+    directly. A zip is saved to disk and handed to a Celery task, which
+    extracts its pdfs and queues each of them, so the request does not
+    wait on decompression.
 
     Args:
         file (File): The uploaded file.
         vessel_id (int): The ID of the vessel associated with the document.
+
+    Returns:
+        list[AsyncResult]: The queued tasks.
     """
+    # Created once at startup by OcrConfig.ready
     upload_directory = os.path.join(MEDIA_ROOT, "documents")
-    os.makedirs(upload_directory, exist_ok=True)
 
     # Persist the raw upload to disk
     unique_filename = f"{django_file.name}"
     disk_path = os.path.join(upload_directory, unique_filename)
     _save_in_chunks(django_file, disk_path)
 
-    # Gather PDF files
     ext = django_file.name.rsplit(".", 1)[-1].lower()
     if ext == "pdf":
-        pdf_paths = [disk_path]
-        logger.info(f"PDF path: {pdf_paths}")
-    else:
-        # unzip then collect PDFs
-        extract_dir = unzip_file(disk_path)
-        pdf_paths = _collect_pdfs(extract_dir)
-
-    # Chunk list to avoid broker overload
-    CHUNK_SIZE = 20
-    task_ids = _chunk_and_dispatch_tasks(
-        pdf_paths,
-        process_pdf_task.delay,
-        CHUNK_SIZE,
-        vessel_id=vessel_id,
-    )
-
-    return task_ids
-
-    # OCR Inference on the pages
-    # TODO
-
-    return
+        logger.info(f"PDF path: {disk_path}")
+        return [process_pdf_task.delay(disk_path, vessel_id=vessel_id)]
+
+    # Reject anything that is not a zip before it is queued
+    try:
+        _check_zipfile(disk_path)
+    except ValueError:
+        os.remove(disk_path)
+        raise
+
+    return [unzip_and_dispatch_task.delay(disk_path, vessel_id)]
@@ -1,5 +1,7 @@
+import ctypes
+
 import cv2 as cv
-import numpy as np
+import pypdfium2 as pdfium
 from loguru import logger
 
 from ocr.main.utils.page_to_img import rotate_landscape
@@ -50,31 +52,72 @@ def get_pdf_object(document_id: int, pdf_lib: str = "pypdfium2"):
         raise
 
 
-def page_to_image(page_obj, page_render_scale: float = 4.0):
+# Upper bound on bytes per pixel for any pdfium bitmap format (BGRA/BGRx).
+_MAX_BYTES_PER_PIXEL = 4
+
+
+def make_reusable_bitmap_maker():
+    """
+    Build a pypdfium2 ``bitmap_maker`` that renders every page into one
+    caller-owned buffer instead of allocating a new one per page.
+
+    The buffer is sized for the largest page seen so far and only grows
+    when a page needs more room, so documents whose pages share the same
+    dimensions allocate it once. Bitmaps made by it are only valid until
+    the next page is rendered.
+
+    Returns:
+        callable: A bitmap maker for ``PdfPage.render(bitmap_maker=...)``.
+    """
+    buffer = None
+
+    def bitmap_maker(width: int, height: int, **kwargs):
+        nonlocal buffer
+        required_size = width * height * _MAX_BYTES_PER_PIXEL
+        if buffer is None or len(buffer) < required_size:
+            buffer = (ctypes.c_ubyte * required_size)()
+        return pdfium.PdfBitmap.new_native(
+            width, height, buffer=buffer, **kwargs
+        )
+
+    return bitmap_maker
+
+
+def page_to_image(page_obj, page_render_scale: float = 4.0, bitmap_maker=None):
     """
     Convert a PDF page object to an image.
 
     Args:
         page_obj: The PDF page object.
         page_render_scale (float): Scale factor for rendering the page.
+        bitmap_maker (callable, optional): Bitmap maker to render into, e.g.
+            one from make_reusable_bitmap_maker. Defaults to a fresh bitmap.
 
     Returns:
-        PIL.Image: The rendered image of the page.
+        np.ndarray: The rendered grayscale image of the page.
     """
+    if bitmap_maker is None:
+        bitmap_maker = pdfium.PdfBitmap.new_native
+
     # Only rotate if page is in portrait orientation (height > width)
     page_obj = rotate_landscape(page_obj, pdf_lib="pypdfium2")
-    page_bitmap = page_obj.render(scale=page_render_scale)
-    page_pil = page_bitmap.to_pil()
-    image_np = np.array(page_pil)
+    page_bitmap = page_obj.render(
+        scale=page_render_scale, bitmap_maker=bitmap_maker
+    )
+    # View over the bitmap buffer (BGR/BGRA); the grayscale conversion
+    # below copies out of it so the buffer can be reused for the next page.
+    image_np = page_bitmap.to_numpy()
 
     if len(image_np.shape) == 3:
-        if image_np.shape[2] == 3:  # RGB
-            gray_image_np = cv.cvtColor(image_np, cv.COLOR_RGB2GRAY)
-        elif image_np.shape[2] == 4:  # RGBA
-            gray_image_np = cv.cvtColor(image_np, cv.COLOR_RGBA2GRAY)
-        else:  # Should not happen with typical PIL images from PDF
-            gray_image_np = image_np  # Fallback, but unlikely
+        if image_np.shape[2] == 3:  # BGR
+            gray_image_np = cv.cvtColor(image_np, cv.COLOR_BGR2GRAY)
+        elif image_np.shape[2] == 4:  # BGRA
+            gray_image_np = cv.cvtColor(image_np, cv.COLOR_BGRA2GRAY)
+        else:  # Should not happen with typical pdfium bitmaps
+            gray_image_np = image_np.copy()  # Fallback, but unlikely
     else:  # Already grayscale or single channel
-        gray_image_np = image_np
+        gray_image_np = image_np.copy()
+
+    page_bitmap.close()
 
     return gray_image_np
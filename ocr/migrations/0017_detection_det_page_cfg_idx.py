@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-16 19:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ocr", "0016_alter_detection_tag"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="detection",
+            index=models.Index(
+                fields=["page", "config"], name="det_page_cfg_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.1 on 2026-10-16 21:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ocr", "0017_detection_det_page_cfg_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="document",
+            index=models.Index(
+                fields=["vessel", "name"], name="doc_vessel_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="document",
+            index=models.Index(
+                fields=["vessel", "document_number"],
+                name="doc_vessel_number_idx",
+            ),
+        ),
+    ]
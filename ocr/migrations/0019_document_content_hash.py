@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-16 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ocr", "0018_document_doc_vessel_name_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=32
+            ),
+        ),
+    ]
@@ -133,6 +133,8 @@ inference_image = (
 )
 
 with inference_image.imports():
+    import cv2 as cv
+    import numpy as np
     from paddleocr import PaddleOCR
 
 _ocr_instances = {}
@@ -267,22 +269,49 @@ KNOWN_OCR_CONFIGS_TO_PREWARM = {
     retries=3,
     volumes={PADDLE_OCR_MODELS_ROOT_IN_VOLUME: volume},
 )
-def ocr_inference(im_numpy, config_id: int, paddle_config: dict):
+def ocr_inference(
+    im_bytes: bytes,
+    config_id: int,
+    paddle_config: dict,
+    regions: list | None = None,
+):
     """
     PaddleOCR inference function.
 
     Args:
-        im_numpy (numpy.ndarray): Input image in numpy format.
+        im_bytes (bytes): Input image encoded as PNG or JPEG.
         config_id (int): Identifier for the OCR configuration to use.
         paddle_config (dict): Configuration options for PaddleOCR.
+        regions (list, optional): (x1, y1, x2, y2) rects to crop and OCR.
+            Each region's polys are offset back into full image coordinates.
+            None runs OCR on the whole image.
 
     Returns:
-        list: List of OCR results.
+        list: List of OCR results, one per image or region.
     """
+    # IMREAD_COLOR always yields 3 channels, even for grayscale uploads
+    im_numpy = cv.imdecode(
+        np.frombuffer(im_bytes, dtype=np.uint8), cv.IMREAD_COLOR
+    )
+    if im_numpy is None:
+        raise ValueError("Could not decode the input image.")
+
     ocr = get_or_create_ocr_instance(
         config_id=config_id,
         user_ocr_params=paddle_config,
     )
-    results = ocr.predict(im_numpy)
+    if regions is None:
+        return ocr.predict(im_numpy)
+
+    crops = [
+        np.ascontiguousarray(im_numpy[y1:y2, x1:x2])
+        for x1, y1, x2, y2 in regions
+    ]
+    results = ocr.predict(crops)
+    for result, (x1, y1, _, _) in zip(results, regions):
+        offset = np.array((x1, y1))
+        result["rec_polys"] = [
+            np.asarray(poly) + offset for poly in result["rec_polys"]
+        ]
 
     return results
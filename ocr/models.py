@@ -30,6 +30,8 @@ class Document(models.Model):
         department_origin (str): The department origin of the document.
         file_path (str): The path to the document file.
         file_size (int): The size of the document file in bytes.
+        content_hash (str): BLAKE2b digest of the file, used to skip
+            re-uploads of identical files.
         last_modified (datetime): The last modified date of the document.
         created_at (datetime): The date when the document was created.
     """
@@ -42,9 +44,25 @@ class Document(models.Model):
     department_origin = models.CharField(max_length=10, blank=True)
     file = models.FileField(upload_to="documents/")
     file_size = models.IntegerField()  # in bytes
+    content_hash = models.CharField(
+        max_length=32, blank=True, default="", db_index=True
+    )
     last_modified = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Uploads check for an existing document on the same vessel by
+            # file name or document number
+            models.Index(
+                fields=["vessel", "name"], name="doc_vessel_name_idx"
+            ),
+            models.Index(
+                fields=["vessel", "document_number"],
+                name="doc_vessel_number_idx",
+            ),
+        ]
+
     def _get_department_origin(self):
         """
         Returns the department origin of the document.
@@ -52,7 +70,9 @@ class Document(models.Model):
         if not self.document_number:
             return ""
 
-        return self.document_number.split("-")[1].strip().upper()
+        # Blank when the document number has no hyphen-separated origin
+        after_hyphen = self.document_number.partition("-")[2]
+        return after_hyphen.partition("-")[0].strip().upper()
 
     def __str__(self):
         return self.name
@@ -224,6 +244,13 @@ class Detection(models.Model):
         Tag, related_name="detections", on_delete=models.SET_NULL, null=True
     )
 
+    class Meta:
+        indexes = [
+            # Detections are looked up per page and config when running,
+            # deleting and filtering OCR results
+            models.Index(fields=["page", "config"], name="det_page_cfg_idx"),
+        ]
+
     def __str__(self):
         return f"{self.page.document.name} - Page {self.page.page_number} - {self.text}"  # noqa E501
 
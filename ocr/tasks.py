@@ -54,6 +54,22 @@ def process_pdf_task(self, disk_path: str, vessel_id: int):
         handle_pdf(django_file, vessel_id)
 
 
+@shared_task(bind=True, ignore_result=True)
+def unzip_and_dispatch_task(self, zip_path: str, vessel_id: int):
+    """
+    Celery task that extracts the pdfs of an uploaded zip and queues a
+    process_pdf_task for each of them.
+
+    Args:
+        zip_path (str): The path to the uploaded zip file on disk.
+        vessel_id (int): The ID of the Vessel associated with the documents.
+    """
+    # handle_upload imports this module, so import it when the task runs
+    from ocr.main.intake.handle_upload import extract_and_dispatch_zip
+
+    extract_and_dispatch_zip(zip_path, vessel_id)
+
+
 # OCR Detections
 _ocr_model_cache = {}
 _model_loading_lock = threading.Lock()
@@ -247,37 +263,32 @@ def draw_ocr_results(self, document_id: int, config_id: int):
             f"Starting draw OCR results for document {document_id}, config {config_id}"  # noqa: E501
         )
 
-        # Clear existing annotated images for this config from all pages
-        pages = Page.objects.filter(document_id=document_id)
+        # Generate annotated images. Images already newer than the tags are
+        # reused, so existing files must not be removed beforehand.
+        generated_files = visualize_document_results(document_id, config_id)
+
+        # Update Page models with image paths
+        pages = list(Page.objects.filter(document_id=document_id))
+
         for page in pages:
-            if (
-                page.annotated_images
-                and str(config_id) in page.annotated_images
-            ):
-                # Remove the file if it exists
-                old_image_path = page.annotated_images[str(config_id)]
+            image_path = generated_files.get(page.page_number)
+            if not page.annotated_images:
+                page.annotated_images = {}
+            old_image_path = page.annotated_images.get(str(config_id))
+
+            # Remove a previous image stored under a different name, or the
+            # stale image of a page that got no new one
+            if old_image_path and old_image_path != image_path:
                 full_path = os.path.join(settings.MEDIA_ROOT, old_image_path)
                 if os.path.exists(full_path):
                     os.remove(full_path)
-
-                # Remove from the JSON field
                 del page.annotated_images[str(config_id)]
-                page.save()
 
-        # Generate annotated images
-        generated_files = visualize_document_results(document_id, config_id)
+            if image_path is None:
+                continue
 
-        # Update Page models with image paths
-        pages = Page.objects.filter(document_id=document_id).order_by(
-            "page_number"
-        )
-
-        for page, image_path in zip(pages, generated_files):
             # Update the annotated_images field
-            if not page.annotated_images:
-                page.annotated_images = {}
             page.annotated_images[str(config_id)] = image_path
-            page.save()
 
             # Debug: Check if the file actually exists
             full_path = os.path.join(settings.MEDIA_ROOT, image_path)
@@ -285,6 +296,9 @@ def draw_ocr_results(self, document_id: int, config_id: int):
             logger.info(f"Full file path: {full_path}")
             logger.info(f"File exists: {os.path.exists(full_path)}")
 
+        # One UPDATE batch instead of a save() per page
+        Page.objects.bulk_update(pages, ["annotated_images"])
+
         logger.info(
             f"Successfully generated {len(generated_files)} annotated images"
         )
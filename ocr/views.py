@@ -1,12 +1,13 @@
 import io
 import zipfile
+from collections import defaultdict
 from pathlib import Path
 
 import markdown
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from loguru import logger
@@ -198,13 +199,15 @@ def documents(request):
         vessels: List of all Vessel objects (for dropdown population).
     """
     selected_vessels = request.GET.getlist("vessels")
-    vessels_qs = Vessel.objects.all()
+    vessels_qs = Vessel.objects.only("id", "name")
     selected_vessel_names = list(
         vessels_qs.filter(id__in=selected_vessels).values_list(
             "name", flat=True
         )  # noqa E501
     )
-    documents = Document.objects.all()
+    # Each row shows its vessel name; join it in rather than querying the
+    # vessel once per listed document
+    documents = Document.objects.select_related("vessel")
     if selected_vessels:
         documents = documents.filter(vessel__id__in=selected_vessels)
     doc_number = request.GET.get("document_number", "").strip()
@@ -297,13 +300,22 @@ def document_detail(request, document_id):
 
     page_data = []
     if selected_config:
+        # Fetch the config's tags for every page in one query instead of
+        # one query per page, then group them by page number.
+        tags_by_page = defaultdict(list)
+        config_tags = (
+            Tag.objects.filter(
+                document=document, detections__config=selected_config
+            )
+            .distinct()
+            .order_by("page_number", "id")
+        )
+        for tag in config_tags:
+            tags_by_page[tag.page_number].append(tag)
+
         for p in pages:
-            tags = Tag.objects.filter(
-                document=document,
-                page_number=p.page_number,
-                detections__config=selected_config,
-            ).distinct()
-            if tags.exists():
+            tags = tags_by_page.get(p.page_number)
+            if tags:
                 annotated_image_url = p.get_annotated_image_url(
                     config_id=selected_config.id
                 )
@@ -329,7 +341,7 @@ def document_detail(request, document_id):
 
     # check if page_detections
     draw_ocr = bool(page_data)
-    has_tags = all(p["tags"].exists() for p in page_data)
+    has_tags = all(p["tags"] for p in page_data)
 
     context = {
         "document": document,
@@ -454,8 +466,8 @@ def delete_documents_from_vessel(request):
     if request.method == "POST":
         form = DeleteDocumentsFromVesselForm(request.POST)
         if form.is_valid():
-            vessel_name = form.cleaned_data["vessel"]
-            vessel = Vessel.objects.get(name=vessel_name)
+            # The form has already loaded the selected Vessel
+            vessel = form.cleaned_data["vessel"]
             documents = Document.objects.filter(vessel=vessel)
 
             # Delete all documents associated with the selected vessel
@@ -553,7 +565,8 @@ def process_detections(request):
     """
     View for processing detections to tags on documents.
     """
-    from ocr.main.utils.task_helpers import _chunk_and_dispatch_tasks
+    from celery import group
+
     from ocr.tasks import process_detections_to_tags
 
     show_no_documents_modal = False
@@ -575,10 +588,14 @@ def process_detections(request):
             document_ids = list(query.values_list("id", flat=True))
 
             if document_ids:
-                task_ids = _chunk_and_dispatch_tasks(
-                    document_ids,
-                    process_detections_to_tags.delay,
-                    chunk_size=10,
+                # One group publishes every task over a single connection
+                task_ids = (
+                    group(
+                        process_detections_to_tags.s(document_id)
+                        for document_id in document_ids
+                    )
+                    .apply_async()
+                    .results
                 )
                 logger.info(f"Dispatched {len(task_ids)} tasks for processing")
                 return redirect("ocr:detect_success")
@@ -819,13 +836,14 @@ def export_pdf(request):
 
                 zip_buf.seek(0)
                 zip_name = f'{vessel.name if vessel else "all_vessels"}_{origin if origin else "all_origins"}_pdfs.zip'  # noqa E501
-                resp = HttpResponse(
-                    zip_buf.getvalue(), content_type="application/zip"
-                )
-                resp["Content-Disposition"] = (
-                    f'attachment; filename="{zip_name}"'
+                # Stream the archive out of the buffer in chunks rather
+                # than copying it whole into the response body
+                return FileResponse(
+                    zip_buf,
+                    as_attachment=True,
+                    filename=zip_name,
+                    content_type="application/zip",
                 )
-                return resp
 
             except Exception as e:
                 logger.error(f"Batch PDF export error: {e}", exc_info=True)